@@ -1,5 +1,11 @@
-import matplotlib.pyplot as plt
+from typing import Callable
 
+# jenis event yang dipancarkan PSO, TRACE berisi teks langkah per partikel
+ITERATION_START: str = "iteration_start"
+ITERATION_END: str = "iteration_end"
+BEST_IMPROVED: str = "best_improved"
+FINISHED: str = "finished"
+TRACE: str = "trace"
 
 def obj_func(x: float) -> float:
     return round(((4.0 * x**2) + x - 2.0) ** 2, 4)
@@ -31,67 +37,92 @@ class PSO:
         self.v_history: list[list[float]] = []
         self.f_x_history: list[float] = []
 
+        # jumlah iterasi yang sudah selesai, dibaca oleh listener
+        self.iteration: int = 0
+
+        # listener untuk setiap event, teks TRACE hanya disusun jika ada
+        # listener yang mendengarkan
+        self.listeners: dict[str, list[Callable[..., None]]] = {}
+
+    def subscribe(self, event: str, listener: Callable[..., None]) -> None:
+        self.listeners.setdefault(event, []).append(listener)
+
+    def emit(self, event: str, *args) -> None:
+        for listener in self.listeners.get(event, ()):
+            listener(*args)
+
     def find_p_best(self) -> None:
-        print(
-            "self.p_best[i] = x[i] if obj_func(x[i]) < obj_func(old_x[i]) else old_x[i]"
-        )
+        tracing: bool = TRACE in self.listeners
+        if tracing:
+            self.emit(
+                TRACE,
+                "self.p_best[i] = x[i] if obj_func(x[i]) < obj_func(old_x[i]) else old_x[i]",
+            )
         for i, (x, old_x) in enumerate(zip(self.x, self.old_x)):
             self.p_best[i] = x if obj_func(x) < obj_func(old_x) else old_x
-            print(
-                f"self.p_best[{i}] = {x} if {obj_func(x)} < {obj_func(old_x)} else {old_x}"
-            )
-        print(f"self.p_best = {self.p_best}\n")
+            if tracing:
+                self.emit(
+                    TRACE,
+                    f"self.p_best[{i}] = {x} if {obj_func(x)} < {obj_func(old_x)} else {old_x}",
+                )
+        if tracing:
+            self.emit(TRACE, f"self.p_best = {self.p_best}\n")
 
     def find_g_best(self) -> None:
-        print(
-            "self.g_best = self.x[min_idx] if obj_func(self.x[min_idx]) < obj_func(self.g_best) else self.g_best"
-        )
+        tracing: bool = TRACE in self.listeners
+        if tracing:
+            self.emit(
+                TRACE,
+                "self.g_best = self.x[min_idx] if obj_func(self.x[min_idx]) < obj_func(self.g_best) else self.g_best",
+            )
         f_values: list[float] = [obj_func(i) for i in self.x]
         min_idx: int = f_values.index(min(f_values))
-        self.g_best = (
-            self.x[min_idx]
-            if obj_func(self.x[min_idx]) < obj_func(self.g_best)
-            else self.g_best
-        )
-        print(
-            f"self.g_best = {self.x[min_idx]} if {obj_func(self.x[min_idx])} < {obj_func(self.g_best)} else {self.g_best}\n"
-        )
-        print(f"self.g_best = {self.g_best} {min_idx}\n")
+        if obj_func(self.x[min_idx]) < obj_func(self.g_best):
+            self.g_best = self.x[min_idx]
+            self.emit(BEST_IMPROVED, self)
+        if tracing:
+            self.emit(
+                TRACE,
+                f"self.g_best = {self.x[min_idx]} if {obj_func(self.x[min_idx])} < {obj_func(self.g_best)} else {self.g_best}\n",
+            )
+            self.emit(TRACE, f"self.g_best = {self.g_best} {min_idx}\n")
 
     def update_v(self) -> None:
-        print(
-            "self.v[i] = (self.w * v[i]) + (self.c[0] * self.r[0] * (p_best[i] - x[i])) + (self.c[1] * self.r[1] * (self.g_best - x[i]))"
-        )
+        tracing: bool = TRACE in self.listeners
+        if tracing:
+            self.emit(
+                TRACE,
+                "self.v[i] = (self.w * v[i]) + (self.c[0] * self.r[0] * (p_best[i] - x[i])) + (self.c[1] * self.r[1] * (self.g_best - x[i]))",
+            )
         for i, (v, x, p_best) in enumerate(zip(self.v, self.x, self.p_best)):
             self.v[i] = (
                 (self.w * v)
                 + (self.c[0] * self.r[0] * (p_best - x))
                 + (self.c[1] * self.r[1] * (self.g_best - x))
             )
-            print(
-                f"self.v[{i}] = ({self.w} * {v}) + ({self.c[0]} * {self.r[0]} * ({p_best} - {x})) + ({self.c[1]} * {self.r[1]} * ({self.g_best} - {x}))"
-            )
-            print(f"self.v[{i}] = {self.v[i]}\n")
+            if tracing:
+                self.emit(
+                    TRACE,
+                    f"self.v[{i}] = ({self.w} * {v}) + ({self.c[0]} * {self.r[0]} * ({p_best} - {x})) + ({self.c[1]} * {self.r[1]} * ({self.g_best} - {x}))",
+                )
+                self.emit(TRACE, f"self.v[{i}] = {self.v[i]}\n")
 
     def update_x(self) -> None:
-        print("self.old_x[i], self.x[i] = x[i], x[i] + v[i]")
+        tracing: bool = TRACE in self.listeners
+        if tracing:
+            self.emit(TRACE, "self.old_x[i], self.x[i] = x[i], x[i] + v[i]")
         for i, (x, v) in enumerate(zip(self.x, self.v)):
             self.old_x[i], self.x[i] = x, x + v
-            print(f"self.old_x[{i}], self.x[{i}] = {x}, {x} + {v}")
-            print(f"self.old_x[{i}], self.x[{i}] = {self.old_x[i]}, {self.x[i]}\n")
+            if tracing:
+                self.emit(TRACE, f"self.old_x[{i}], self.x[{i}] = {x}, {x} + {v}")
+                self.emit(
+                    TRACE,
+                    f"self.old_x[{i}], self.x[{i}] = {self.old_x[i]}, {self.x[i]}\n",
+                )
 
     def iterate(self, n) -> None:
-        print(
-            f"""Iterasi ke-0
-fungsi objektif = (4x^2 + x - 2)^2
-nilai x = {self.x}
-nilai v = {self.v}
-nilai c = {self.c}
-nilai r = {self.r}
-nilai w = {self.w}
-"""
-        )
-        for i in range(n):
+        for _ in range(n):
+            self.emit(ITERATION_START, self)
             self.find_g_best()
             self.find_p_best()
             self.update_v()
@@ -102,6 +133,8 @@ nilai w = {self.w}
             self.g_best_history.append(self.g_best)
             self.v_history.append(self.v.copy())
             self.f_x_history.append(obj_func(self.g_best))
+            self.iteration += 1
+            self.emit(ITERATION_END, self)
 
         #             print(
         #                 f"""iterasi ke-{i+1}
@@ -113,9 +146,11 @@ nilai w = {self.w}
         # 6.) update x = {self.x}\n"""
         #             )
 
-        print(f"nilai minimum dari f(x) adalah {obj_func(self.g_best)}")
+        self.emit(FINISHED, self)
 
     def plot(self):
+        import matplotlib.pyplot as plt
+
         fig, axs = plt.subplots(2, 2, figsize=(15, 15))
 
         axs[0, 0].plot(range(1, len(self.x_history) + 1), self.x_history)
@@ -157,6 +192,26 @@ nilai w = {self.w}
         plt.show()
 
 
+def print_parameters(pso: PSO) -> None:
+    # listener ITERATION_START, mencetak nilai awal sebelum iterasi pertama
+    if pso.iteration == 0:
+        print(
+            f"""Iterasi ke-0
+fungsi objektif = (4x^2 + x - 2)^2
+nilai x = {pso.x}
+nilai v = {pso.v}
+nilai c = {pso.c}
+nilai r = {pso.r}
+nilai w = {pso.w}
+"""
+        )
+
+
+def print_result(pso: PSO) -> None:
+    # listener FINISHED, mencetak nilai minimum yang ditemukan
+    print(f"nilai minimum dari f(x) adalah {obj_func(pso.g_best)}")
+
+
 def main() -> None:
     x_0: float = 0.0
     x_1: float = 0.5
@@ -179,6 +234,9 @@ def main() -> None:
         random_numbers,
         inertia_weight,
     )
+    pso.subscribe(ITERATION_START, print_parameters)
+    pso.subscribe(TRACE, print)
+    pso.subscribe(FINISHED, print_result)
     pso.iterate(3)
     # pso.plot()
 
@@ -1,6 +1,12 @@
 # import library yang dibutuhkan
 import random
-import matplotlib.pyplot as plt
+from typing import Callable
+
+# jenis event yang dipancarkan PSO
+ITERATION_START: str = "iteration_start"
+ITERATION_END: str = "iteration_end"
+BEST_IMPROVED: str = "best_improved"
+FINISHED: str = "finished"
 
 
 # fungsi objektif yang akan dioptimasi
@@ -47,6 +53,19 @@ class PSO:
         self.v_history: list[list[float]] = []
         self.f_x_history: list[float] = []
 
+        # jumlah iterasi yang sudah selesai, dibaca oleh listener
+        self.iteration: int = 0
+
+        # listener untuk setiap event, dipanggil lewat emit()
+        self.listeners: dict[str, list[Callable[..., None]]] = {}
+
+    def subscribe(self, event: str, listener: Callable[..., None]) -> None:
+        self.listeners.setdefault(event, []).append(listener)
+
+    def emit(self, event: str, *args) -> None:
+        for listener in self.listeners.get(event, ()):
+            listener(*args)
+
     def find_p_best(self) -> None:
         # memperbarui nilai pBest jika f(x) lebih kecil dari f(x) sebelumnya
         for i, (x, old_x) in enumerate(zip(self.x, self.old_x)):
@@ -56,11 +75,9 @@ class PSO:
         # memperbarui nilai gBest jika f(x) lebih kecil dari f(x) sebelumnya
         f_values: list[float] = [obj_func(i) for i in self.x]
         minimum_index: int = f_values.index(min(f_values))
-        self.g_best = (
-            self.x[minimum_index]
-            if obj_func(self.x[minimum_index]) < obj_func(self.g_best)
-            else self.g_best
-        )
+        if obj_func(self.x[minimum_index]) < obj_func(self.g_best):
+            self.g_best = self.x[minimum_index]
+            self.emit(BEST_IMPROVED, self)
 
     def update_v(self) -> None:
         """
@@ -81,16 +98,8 @@ class PSO:
 
     def iterate(self, n) -> None:
         # menjalankan algoritma PSO sebanyak n iterasi
-        print(
-            f"""Iterasi ke-0
-nilai x = {self.x}
-nilai v = {self.v}
-nilai c = {self.c}
-nilai r = {self.r}
-nilai w = {self.w}
-"""
-        )
-        for i in range(n):
+        for _ in range(n):
+            self.emit(ITERATION_START, self)
             self.find_g_best()
             self.find_p_best()
             self.update_v()
@@ -101,20 +110,14 @@ nilai w = {self.w}
             self.g_best_history.append(self.g_best)
             self.v_history.append(self.v.copy())
             self.f_x_history.append(obj_func(self.g_best))
+            self.iteration += 1
+            self.emit(ITERATION_END, self)
 
-            print(
-                f"""iterasi ke-{i+1}
-1.) menentukan x = {[float(f"{i:.4f}") for i in self.old_x]}
-2.) menentukan f(x) = {[float(f"{obj_func(i):.4f}") for i in self.old_x]}
-3.) menentukan gBest = {self.g_best:.4f}
-4.) menentukan pBest = {[float(f"{i:.4f}") for i in self.p_best]}
-5.) menentukan v = {[float(f"{i:.4f}") for i in self.v]}
-6.) update x = {[float(f"{i:.4f}") for i in self.x]}\n"""
-            )
-
-        print(f"nilai minimum dari f(x) adalah {obj_func(self.g_best)}")
+        self.emit(FINISHED, self)
 
     def plot(self):
+        import matplotlib.pyplot as plt
+
         fig, axs = plt.subplots(2, 2, figsize=(15, 15))
 
         axs[0, 0].plot(range(1, len(self.x_history) + 1), self.x_history)
@@ -153,6 +156,38 @@ nilai w = {self.w}
         plt.show()
 
 
+def print_parameters(pso: PSO) -> None:
+    # listener ITERATION_START, mencetak nilai awal sebelum iterasi pertama
+    if pso.iteration == 0:
+        print(
+            f"""Iterasi ke-0
+nilai x = {pso.x}
+nilai v = {pso.v}
+nilai c = {pso.c}
+nilai r = {pso.r}
+nilai w = {pso.w}
+"""
+        )
+
+
+def print_iteration(pso: PSO) -> None:
+    # listener ITERATION_END, mencetak langkah-langkah iterasi yang baru selesai
+    print(
+        f"""iterasi ke-{pso.iteration}
+1.) menentukan x = {[float(f"{i:.4f}") for i in pso.old_x]}
+2.) menentukan f(x) = {[float(f"{obj_func(i):.4f}") for i in pso.old_x]}
+3.) menentukan gBest = {pso.g_best:.4f}
+4.) menentukan pBest = {[float(f"{i:.4f}") for i in pso.p_best]}
+5.) menentukan v = {[float(f"{i:.4f}") for i in pso.v]}
+6.) update x = {[float(f"{i:.4f}") for i in pso.x]}\n"""
+    )
+
+
+def print_result(pso: PSO) -> None:
+    # listener FINISHED, mencetak nilai minimum yang ditemukan
+    print(f"nilai minimum dari f(x) adalah {obj_func(pso.g_best)}")
+
+
 if __name__ == "__main__":
     # Inisialisasi parameter algoritma PSO
     v_0: float = 0.0
@@ -175,5 +210,8 @@ if __name__ == "__main__":
         random_numbers,
         inertia_weight,
     )
+    pso.subscribe(ITERATION_START, print_parameters)
+    pso.subscribe(ITERATION_END, print_iteration)
+    pso.subscribe(FINISHED, print_result)
     pso.iterate(3)
     pso.plot()
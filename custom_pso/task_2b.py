@@ -1,6 +1,12 @@
 # Import library yang dibutuhkan
 import random
-import matplotlib.pyplot as plt
+from typing import Callable
+
+# jenis event yang dipancarkan PSO
+ITERATION_START: str = "iteration_start"
+ITERATION_END: str = "iteration_end"
+BEST_IMPROVED: str = "best_improved"
+FINISHED: str = "finished"
 
 
 # fungsi objektif yang akan dioptimasi
@@ -71,6 +77,19 @@ class PSO:
         self.vy_history: list[list[float]] = []
         self.f_x_history: list[float] = []
 
+        # jumlah iterasi yang sudah selesai, dibaca oleh listener
+        self.iteration: int = 0
+
+        # listener untuk setiap event, dipanggil lewat emit()
+        self.listeners: dict[str, list[Callable[..., None]]] = {}
+
+    def subscribe(self, event: str, listener: Callable[..., None]) -> None:
+        self.listeners.setdefault(event, []).append(listener)
+
+    def emit(self, event: str, *args) -> None:
+        for listener in self.listeners.get(event, ()):
+            listener(*args)
+
     def find_p_best(self) -> None:
         # Memperbarui posisi terbaik untuk setiap partikel
         for i, (x, y, old_x, old_y) in enumerate(
@@ -89,12 +108,11 @@ class PSO:
         # Memperbarui posisi terbaik diantara semua partikel
         f_values = [obj_func(x, y) for x, y in zip(self.x, self.y)]
         minimum_index = f_values.index(min(f_values))
-        self.g_best = (
-            [self.x[minimum_index], self.y[minimum_index]]
-            if obj_func(self.x[minimum_index], self.y[minimum_index])
-            < obj_func(self.g_best[0], self.g_best[1])
-            else self.g_best
-        )
+        if obj_func(self.x[minimum_index], self.y[minimum_index]) < obj_func(
+            self.g_best[0], self.g_best[1]
+        ):
+            self.g_best = [self.x[minimum_index], self.y[minimum_index]]
+            self.emit(BEST_IMPROVED, self)
 
     def update_velocities(self) -> None:
         """
@@ -122,16 +140,8 @@ class PSO:
 
     def iterate(self, n) -> None:
         # Menjalan algoritma PSO selama n iterasi
-        print(
-            f"""Iterasi ke-0
-nilai (x,y) = {list(zip(self.x, self.y))}
-nilai (vx,vy) = {self.v}
-nilai c = {self.c}
-nilai r = {self.r}
-nilai w = {self.w}
-"""
-        )
-        for i in range(n):
+        for _ in range(n):
+            self.emit(ITERATION_START, self)
             self.find_p_best()
             self.find_g_best()
             self.update_velocities()
@@ -145,20 +155,13 @@ nilai w = {self.w}
             self.vx_history.append([vx[0] for vx in self.v])
             self.vy_history.append([vy[1] for vy in self.v])
             self.f_x_history.append(obj_func(self.g_best[0], self.g_best[1]))
-            print(
-                f"""Iterasi ke-{i+1}
-1.) menentukan (x,y) = {[f"({x:.4f}, {y:.4f})" for x, y in zip(self.old_x, self.old_y)]}
-2.) menentukan f(x,y) = {[round(obj_func(x, y),4) for x, y in zip(self.old_x, self.old_y)]}
-3.) menentukan gBest = {f"({self.g_best[0]:.4f}, {self.g_best[1]:.4f})"}
-4.) menentukan pBest = {[f"({x:.4f}, {y:.4f})" for x, y in zip(self.p_best[0], self.p_best[1])]}
-5.) menentukan (vx,vy) = {[f"({x:.4f}, {y:.4f})" for x, y in zip(self.v[0], self.v[1])]}
-6.) update (x,y) = {[f"({x:.4f}, {y:.4f})" for x,y in zip(self.x, self.y)]}\n"""
-            )
-        print(
-            f"Nilai minimum dari f(x,y) adalah {obj_func(self.g_best[0], self.g_best[1]):.4f}"
-        )
+            self.iteration += 1
+            self.emit(ITERATION_END, self)
+        self.emit(FINISHED, self)
 
     def plot(self) -> None:
+        import matplotlib.pyplot as plt
+
         fig, axs = plt.subplots(2, 4, figsize=(15, 10))
         axs[0, 0].plot(range(1, len(self.x_history) + 1), self.x_history)
         axs[0, 0].set_xlabel("iterasi")
@@ -203,6 +206,40 @@ nilai w = {self.w}
         plt.show()
 
 
+def print_parameters(pso: PSO) -> None:
+    # Listener ITERATION_START, mencetak nilai awal sebelum iterasi pertama
+    if pso.iteration == 0:
+        print(
+            f"""Iterasi ke-0
+nilai (x,y) = {list(zip(pso.x, pso.y))}
+nilai (vx,vy) = {pso.v}
+nilai c = {pso.c}
+nilai r = {pso.r}
+nilai w = {pso.w}
+"""
+        )
+
+
+def print_iteration(pso: PSO) -> None:
+    # Listener ITERATION_END, mencetak langkah-langkah iterasi yang baru selesai
+    print(
+        f"""Iterasi ke-{pso.iteration}
+1.) menentukan (x,y) = {[f"({x:.4f}, {y:.4f})" for x, y in zip(pso.old_x, pso.old_y)]}
+2.) menentukan f(x,y) = {[round(obj_func(x, y),4) for x, y in zip(pso.old_x, pso.old_y)]}
+3.) menentukan gBest = {f"({pso.g_best[0]:.4f}, {pso.g_best[1]:.4f})"}
+4.) menentukan pBest = {[f"({x:.4f}, {y:.4f})" for x, y in zip(pso.p_best[0], pso.p_best[1])]}
+5.) menentukan (vx,vy) = {[f"({x:.4f}, {y:.4f})" for x, y in zip(pso.v[0], pso.v[1])]}
+6.) update (x,y) = {[f"({x:.4f}, {y:.4f})" for x,y in zip(pso.x, pso.y)]}\n"""
+    )
+
+
+def print_result(pso: PSO) -> None:
+    # Listener FINISHED, mencetak nilai minimum yang ditemukan
+    print(
+        f"Nilai minimum dari f(x,y) adalah {obj_func(pso.g_best[0], pso.g_best[1]):.4f}"
+    )
+
+
 # Menyiapkan kondisi awal dan parameter
 v_0 = 0.0
 c_1 = 1.0
@@ -238,5 +275,8 @@ if __name__ == "__main__":
         random_numbers,
         inertia_weight,
     )
+    pso.subscribe(ITERATION_START, print_parameters)
+    pso.subscribe(ITERATION_END, print_iteration)
+    pso.subscribe(FINISHED, print_result)
     pso.iterate(3)
     pso.plot()
@@ -1,5 +1,12 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+from events import Events
+
+# Jenis event Dijkstra, terpisah dari event iterasi PSO karena argumennya
+# berbeda
+INITIALIZED = "initialized"
+START_NODE_SET = "start_node_set"
+NODE_EXPLORED = "node_explored"
+DISTANCE_UPDATED = "distance_updated"
+PATH_FOUND = "path_found"
 
 class Node:
     def __init__(self, name, neighbors):
@@ -13,29 +20,32 @@ class Dijkstra:
         # Membuat objek Node untuk setiap node dalam graf
         for name, neighbors in graph.items():
             graph[name] = Node(name, neighbors)
+        # Listener event: INITIALIZED(distance, predecessor),
+        # START_NODE_SET(start_node, distance, queue),
+        # NODE_EXPLORED(node, jarak, distance, predecessor),
+        # DISTANCE_UPDATED(neighbor, distance, predecessor) dan PATH_FOUND(path)
+        self.events = Events()
 
     def find_shortest_path(self, start_node, end_node):
         # Inisialisasi jarak ke setiap node sebagai tak terhingga
         distance = {node: float('inf') for node in self.graph}
-        print(f"Initial distance: {distance}")
         
         # Inisialisasi node pendahulu ke setiap node sebagai None
         predecessor = {node: None for node in self.graph}
-        print(f"Initial predecessors: {predecessor}")
+        self.events.emit(INITIALIZED, distance, predecessor)
         
         # Jarak dari start_node ke dirinya sendiri diatur sebagai 0
         distance[start_node] = 0
-        print(f"Set distance of {start_node} to 0: {distance}")
         
         # Antrian untuk menyimpan pasangan jarak-node yang akan dieksplorasi
         queue = [(0, start_node)]
-        print(f"Initial queue: {queue}")
+        self.events.emit(START_NODE_SET, start_node, distance, queue)
         
         # Algoritma Dijkstra
         while queue:
             current_distance, current_node = min(queue)
             queue.remove((current_distance, current_node))
-            print(f"\nExploring {current_node} with distance {current_distance}")
+            self.events.emit(NODE_EXPLORED, current_node, current_distance, distance, predecessor)
             
             for neighbor, weight in self.graph[current_node].neighbors.items():
                 new_distance = current_distance + weight
@@ -43,13 +53,12 @@ class Dijkstra:
                     distance[neighbor] = new_distance
                     predecessor[neighbor] = current_node
                     queue.append((new_distance, neighbor))
-                    print(f"Updated distance to {neighbor}: {distance}")
-                    print(f"Updated predecessor of {neighbor}: {predecessor}")
+                    self.events.emit(DISTANCE_UPDATED, neighbor, distance, predecessor)
 
         # Mendapatkan jarak terpendek dari start_node ke end_node
         shortest_distance = distance[end_node]
         if shortest_distance == float('inf'):
-            print("No path found.")
+            self.events.emit(PATH_FOUND, None)
             return None  # Tidak ada jalur yang ditemukan
 
         # Membuat jalur dari end_node ke start_node
@@ -57,14 +66,47 @@ class Dijkstra:
         while path[-1] != start_node:
             path.append(predecessor[path[-1]])
 
-        print(f"\nShortest path from {start_node} to {end_node}: {path[::-1]}")
+        self.events.emit(PATH_FOUND, path[::-1])
         return path[::-1]
 
 
+def print_initialized(distance, predecessor):
+    # Listener INITIALIZED, mencetak jarak dan pendahulu awal
+    print(f"Initial distance: {distance}")
+    print(f"Initial predecessors: {predecessor}")
+
+
+def print_start_node_set(start_node, distance, queue):
+    # Listener START_NODE_SET, mencetak jarak setelah node awal diatur dan
+    # antrian awal
+    print(f"Set distance of {start_node} to 0: {distance}")
+    print(f"Initial queue: {queue}")
+
+
+def print_exploring(node, node_distance, distance, predecessor):
+    # Listener NODE_EXPLORED, mencetak node yang sedang dieksplorasi
+    print(f"\nExploring {node} with distance {node_distance}")
 
 
+def print_updated(neighbor, distance, predecessor):
+    # Listener DISTANCE_UPDATED, mencetak jarak dan pendahulu yang diperbarui
+    print(f"Updated distance to {neighbor}: {distance}")
+    print(f"Updated predecessor of {neighbor}: {predecessor}")
+
+
+def print_finished(path):
+    # Listener PATH_FOUND, mencetak jalur terpendek yang ditemukan
+    if path is None:
+        print("No path found.")
+    else:
+        print(f"\nShortest path from {path[0]} to {path[-1]}: {path}")
+
 
 def visualize_graph_with_highlighted_path(graph, shortest_path):
+    # networkx dan matplotlib diimpor saat dipakai agar import modul tetap ringan
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     # Membuat objek graf dari NetworkX
     G = nx.DiGraph()
     # Menambahkan node dan edge ke graf
@@ -107,6 +149,11 @@ def main():
 
     # Membuat objek djikstra
     DJK:Dijkstra = Dijkstra(graph)
+    DJK.events.subscribe(INITIALIZED, print_initialized)
+    DJK.events.subscribe(START_NODE_SET, print_start_node_set)
+    DJK.events.subscribe(NODE_EXPLORED, print_exploring)
+    DJK.events.subscribe(DISTANCE_UPDATED, print_updated)
+    DJK.events.subscribe(PATH_FOUND, print_finished)
     # Mencari jalur terpendek dari start_node ke end_node
     shortest_path = DJK.find_shortest_path(start_node, end_node)
 
@@ -0,0 +1,30 @@
+from typing import Callable
+
+# jenis event yang dipancarkan selama algoritma berjalan
+ITERATION_START: str = "iteration_start"
+ITERATION_END: str = "iteration_end"
+BEST_IMPROVED: str = "best_improved"
+FINISHED: str = "finished"
+
+
+# Penampung listener (observer) untuk setiap jenis event
+class Events:
+    def __init__(self) -> None:
+        self.listeners: dict[str, list[Callable[..., None]]] = {}
+
+    def subscribe(self, event: str, listener: Callable[..., None]) -> None:
+        self.listeners.setdefault(event, []).append(listener)
+
+    def unsubscribe(self, event: str, listener: Callable[..., None]) -> None:
+        self.listeners[event].remove(listener)
+        if not self.listeners[event]:
+            del self.listeners[event]
+
+    def emit(self, event: str, *args) -> None:
+        """
+        Memanggil setiap listener event dengan args. Tanpa listener, emit
+        hanya berupa satu pencarian dict; pemformatan teks dilakukan oleh
+        listener, bukan oleh algoritma.
+        """
+        for listener in self.listeners.get(event, ()):
+            listener(*args)
@@ -0,0 +1,171 @@
+import asyncio
+from typing import Awaitable, Callable
+
+import numpy as np
+
+from events import FINISHED
+from pso_stopping import Result, StoppingCriteria
+from pso_vectorized import PSO, as_swarm, obj_func, print_result
+
+
+async def evaluate_async(
+    obj_func: Callable[..., Awaitable[float]],
+    positions: np.ndarray,
+    max_in_flight: int,
+) -> np.ndarray:
+    """
+    Mengevaluasi fungsi objektif async untuk setiap baris positions, dengan
+    paling banyak max_in_flight evaluasi berjalan bersamaan.
+
+    Parameter:
+    - obj_func: Fungsi async obj_func(*posisi), atau obj_func(posisi) untuk
+      fungsi yang ditandai pso_evaluation.vector_objective
+    - positions: Array posisi (n_particles, n_dims)
+    - max_in_flight: Batas evaluasi yang menunggu bersamaan (semaphore)
+    """
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(max_in_flight)
+    unpack: bool = getattr(obj_func, "unpack", True)
+
+    async def evaluate_one(position: np.ndarray) -> float:
+        async with semaphore:
+            return await (obj_func(*position) if unpack else obj_func(position))
+
+    return np.array(
+        await asyncio.gather(*(evaluate_one(position) for position in positions)),
+        dtype=np.float64,
+    )
+
+
+# PSO untuk fungsi objektif async yang sebagian besar waktunya menunggu I/O
+class AsyncPSO(PSO):
+    def __init__(
+        self,
+        x,
+        v,
+        c: list[float],
+        r: list[float] | None,
+        w: float,
+        obj_func: Callable[..., Awaitable[float]],
+        fitness: np.ndarray,
+        max_in_flight: int = 8,
+        **kwargs,
+    ) -> None:
+        """
+        Inisialisasi PSO async. f(x) awal harus sudah dihitung karena
+        konstruktor tidak bisa menunggu (await); gunakan AsyncPSO.create.
+
+        Parameter:
+        - x, v, c, r, w, kwargs: Sama seperti PSO
+        - obj_func: Fungsi objektif async (async def)
+        - fitness: f(x) awal
+        - max_in_flight: Batas evaluasi yang berjalan bersamaan
+        """
+        super().__init__(x, v, c, r, w, obj_func, fitness=fitness, **kwargs)
+        self.async_obj_func: Callable[..., Awaitable[float]] = obj_func
+        self.max_in_flight: int = max_in_flight
+
+    @classmethod
+    async def create(
+        cls,
+        x,
+        v,
+        c: list[float],
+        r: list[float] | None,
+        w: float,
+        obj_func: Callable[..., Awaitable[float]],
+        max_in_flight: int = 8,
+        **kwargs,
+    ) -> "AsyncPSO":
+        # mengevaluasi posisi awal secara async lalu membuat AsyncPSO
+        positions: np.ndarray = as_swarm(x)
+        fitness: np.ndarray = await evaluate_async(obj_func, positions, max_in_flight)
+        pso: AsyncPSO = cls(
+            positions, v, c, r, w, obj_func, fitness, max_in_flight, **kwargs
+        )
+        pso.n_evals += len(positions)
+        return pso
+
+    async def update_fitness_async(self) -> None:
+        # versi async dari update_fitness, posisi dievaluasi paling banyak sekali
+        if not self.f_x_valid:
+            self.f_x = await evaluate_async(
+                self.async_obj_func, self.x, self.max_in_flight
+            )
+            self.n_evals += len(self.x)
+            self.f_x_valid = True
+
+    async def iterate(
+        self,
+        n: int,
+        stop: StoppingCriteria | None = None,
+        checkpoint_path: str | None = None,
+        checkpoint_every: int = 100,
+    ) -> Result:
+        """
+        Menjalankan algoritma PSO paling banyak n iterasi. Evaluasi setiap
+        iterasi berjalan bersamaan, sisanya sama dengan PSO.iterate.
+        """
+        start: int = self.begin(n, stop, checkpoint_path, checkpoint_every)
+        for _ in range(n):
+            await self.update_fitness_async()
+            self.step()
+            self.write_checkpoint()
+            if self.should_stop(stop):
+                break
+        return self.finish(start)
+
+
+# Objektif yang dihitung oleh layanan simulasi lewat TCP
+class RemoteObjective:
+    def __init__(self, host: str, port: int) -> None:
+        self.host: str = host
+        self.port: int = port
+
+    async def __call__(self, *position: float) -> float:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        writer.write((" ".join(map(str, position)) + "\n").encode())
+        await writer.drain()
+        value: float = float(await reader.readline())
+        writer.close()
+        await writer.wait_closed()
+        return value
+
+
+async def simulation_service(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    # pengganti layanan simulasi lokal: menunggu sebentar lalu menghitung f(x)
+    position: list[float] = list(map(float, (await reader.readline()).split()))
+    await asyncio.sleep(0.01)
+    writer.write(f"{obj_func(*position)!r}\n".encode())
+    await writer.drain()
+    writer.close()
+
+
+async def run() -> None:
+    server: asyncio.Server = await asyncio.start_server(
+        simulation_service, "127.0.0.1", 0
+    )
+    host, port = server.sockets[0].getsockname()[:2]
+    async with server:
+        rng: np.random.Generator = np.random.default_rng(0)
+        pso: AsyncPSO = await AsyncPSO.create(
+            rng.uniform(-5.0, 5.0, (50, 2)),
+            0.0,
+            [1.0, 0.5],
+            None,
+            0.7,
+            RemoteObjective(host, port),
+            max_in_flight=25,
+            seed=rng,
+        )
+        pso.events.subscribe(FINISHED, print_result)
+        await pso.iterate(10)
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
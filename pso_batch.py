@@ -0,0 +1,225 @@
+from typing import Callable
+
+import numpy as np
+
+from events import BEST_IMPROVED, FINISHED, ITERATION_END, ITERATION_START, Events
+from pso_evaluation import as_batch_objective, batch_objective
+from pso_stopping import MAX_ITERATIONS, Result
+from pso_vectorized import as_swarm
+
+
+@batch_objective
+def obj_func(positions: np.ndarray) -> np.ndarray:
+    # fungsi objektif pso_single_variable, f(x) = x / (x^2 + 1)
+    x: np.ndarray = positions[:, 0]
+    return x / (x**2 + 1.0)
+
+
+def per_replica(values, n_replicas: int, width: int) -> np.ndarray:
+    # menyamakan parameter skalar/list menjadi array (n_replicas, width)
+    return np.broadcast_to(
+        np.array(values, dtype=np.float64).reshape(-1, width), (n_replicas, width)
+    ).copy()
+
+
+# Banyak PSO independen yang dijalankan sekaligus sebagai satu array
+class BatchPSO:
+    def __init__(
+        self,
+        x,
+        v,
+        c,
+        r,
+        w,
+        obj_func: Callable = obj_func,
+        n_replicas: int | None = None,
+        seed=None,
+        dtype: type = np.float64,
+    ) -> None:
+        """
+        Inisialisasi R replika PSO dengan state berbentuk array
+        (n_replicas, n_particles, n_dims). Setiap replika boleh memiliki c, r,
+        w, posisi awal dan seed sendiri, sehingga satu sapuan parameter
+        cukup dijalankan dengan satu objek, bukan ratusan objek PSO.
+
+        Parameter:
+        - x: Posisi awal (n_particles, n_dims) yang sama untuk setiap replika,
+          atau (n_replicas, n_particles, n_dims)
+        - v: Velocity awal, skalar atau array yang bisa di-broadcast ke x
+        - c: [c1, c2] untuk semua replika, atau array (n_replicas, 2)
+        - r: [r1, r2] tetap, array (n_replicas, 2), atau None agar r1 dan r2
+          diambil ulang per replika, partikel, dimensi dan iterasi
+        - w: Inertia weight, skalar atau array (n_replicas,)
+        - obj_func: Fungsi objektif seperti pada pso_vectorized.PSO, seluruh
+          partikel semua replika dievaluasi dalam satu panggilan batch
+        - n_replicas: Jumlah replika, default diambil dari x, c, r atau w
+        - seed: Satu seed untuk seluruh replika (r diambil sekaligus), atau
+          list berisi seed per replika; replika k lalu identik dengan
+          pso_vectorized.PSO(..., seed=seed[k])
+        - dtype: Tipe data posisi, velocity dan best seperti pada
+          pso_vectorized.PSO, f(x) tetap float64
+        """
+        self.dtype: type = np.dtype(dtype).type
+        x = np.array(x, dtype=self.dtype)
+        if x.ndim < 3:
+            x = as_swarm(x, self.dtype)
+        if n_replicas is None:
+            # argumen yang berisi nilai per replika menentukan jumlah replika
+            per_replica_args: list[int] = [
+                len(value)
+                for value, ndim in ((x, 3), (c, 2), (r, 2), (w, 1), (seed, 1))
+                if value is not None
+                and not isinstance(value, (int, np.random.Generator))
+                and np.ndim(value) == ndim
+            ]
+            n_replicas = max(per_replica_args, default=1)
+        self.n_replicas: int = n_replicas
+        self.x: np.ndarray = np.broadcast_to(x, (n_replicas, *x.shape[-2:])).copy()
+        self.v: np.ndarray = np.broadcast_to(
+            np.array(v, dtype=self.dtype), self.x.shape
+        ).copy()
+        # c, r dan w bertipe sama dengan state agar perkalian tidak mengubah
+        # tipe velocity
+        self.c: np.ndarray = per_replica(c, n_replicas, 2).astype(self.dtype)
+        self.r: np.ndarray | None = (
+            per_replica(r, n_replicas, 2).astype(self.dtype) if r is not None else None
+        )
+        self.w: np.ndarray = per_replica(w, n_replicas, 1)[:, 0].astype(self.dtype)
+        self.obj_func: Callable[[np.ndarray], np.ndarray] = as_batch_objective(obj_func)
+        self.rngs: list[np.random.Generator] | None = None
+        if isinstance(seed, (list, tuple, np.ndarray)):
+            self.rngs = [np.random.default_rng(s) for s in seed]
+        self.rng: np.random.Generator = np.random.default_rng(
+            None if self.rngs is not None else seed
+        )
+        self.events: Events = Events()
+
+        # jumlah evaluasi per replika
+        self.n_evals: int = 0
+
+        self.old_x: np.ndarray = self.x.copy()
+        self.p_best: np.ndarray = self.x.copy()
+        self.f_x: np.ndarray = self.evaluate(self.x)
+        self.f_old_x: np.ndarray = self.f_x.copy()
+        self.f_p_best: np.ndarray = self.f_x.copy()
+        minimum_index: np.ndarray = np.argmin(self.f_x, axis=1)
+        replicas: np.ndarray = np.arange(n_replicas)
+        self.g_best: np.ndarray = self.x[replicas, minimum_index]
+        self.f_g_best: np.ndarray = self.f_x[replicas, minimum_index]
+        self.f_x_valid: bool = True
+        self.iteration: int = 0
+
+    def evaluate(self, positions: np.ndarray) -> np.ndarray:
+        # seluruh replika dievaluasi dalam satu panggilan fungsi batch
+        self.n_evals += positions.shape[1]
+        n_replicas, n_particles, n_dims = positions.shape
+        return np.asarray(
+            self.obj_func(positions.reshape(-1, n_dims)), dtype=np.float64
+        ).reshape(n_replicas, n_particles)
+
+    def update_fitness(self) -> None:
+        if not self.f_x_valid:
+            self.f_x = self.evaluate(self.x)
+            self.f_x_valid = True
+
+    def find_p_best(self) -> None:
+        self.update_fitness()
+        improved: np.ndarray = self.f_x < self.f_old_x
+        self.p_best = np.where(improved[..., np.newaxis], self.x, self.old_x)
+        self.f_p_best = np.where(improved, self.f_x, self.f_old_x)
+
+    def find_g_best(self) -> None:
+        # gBest setiap replika diperbarui jika f(x) terkecilnya lebih kecil
+        self.update_fitness()
+        minimum_index: np.ndarray = np.argmin(self.f_x, axis=1)
+        replicas: np.ndarray = np.arange(self.n_replicas)
+        f_minimum: np.ndarray = self.f_x[replicas, minimum_index]
+        improved: np.ndarray = f_minimum < self.f_g_best
+        if improved.any():
+            self.g_best[improved] = self.x[replicas, minimum_index][improved]
+            self.f_g_best[improved] = f_minimum[improved]
+            self.events.emit(BEST_IMPROVED, self)
+
+    def random(self) -> tuple[np.ndarray, np.ndarray]:
+        # r1 dan r2 berbentuk (n_replicas, n_particles, n_dims)
+        if self.rngs is None:
+            return self.rng.random((2, *self.x.shape), dtype=self.dtype)
+        r_1, r_2 = np.stack(
+            [rng.random((2, *self.x.shape[1:]), dtype=self.dtype) for rng in self.rngs],
+            1,
+        )
+        return r_1, r_2
+
+    def update_v(self) -> None:
+        if self.r is not None:
+            r_1, r_2 = self.r[:, 0, None, None], self.r[:, 1, None, None]
+        else:
+            r_1, r_2 = self.random()
+        self.v = (
+            (self.w[:, None, None] * self.v)
+            + (self.c[:, 0, None, None] * r_1 * (self.p_best - self.x))
+            + (self.c[:, 1, None, None] * r_2 * (self.g_best[:, np.newaxis] - self.x))
+        )
+
+    def update_x(self) -> None:
+        self.update_fitness()
+        self.old_x[:] = self.x
+        self.f_old_x = self.f_x
+        self.x += self.v
+        self.f_x_valid = False
+
+    def step(self) -> None:
+        self.events.emit(ITERATION_START, self)
+        self.find_g_best()
+        self.find_p_best()
+        self.update_v()
+        self.update_x()
+        self.iteration += 1
+        self.events.emit(ITERATION_END, self)
+
+    def iterate(self, n: int) -> list[Result]:
+        """
+        Menjalankan seluruh replika sebanyak n iterasi dan mengembalikan
+        Result untuk setiap replika.
+        """
+        for _ in range(n):
+            self.step()
+        self.events.emit(FINISHED, self)
+        return [
+            Result(
+                self.g_best[k].copy(),
+                float(self.f_g_best[k]),
+                n,
+                self.n_evals,
+                MAX_ITERATIONS,
+            )
+            for k in range(self.n_replicas)
+        ]
+
+
+def print_result(batch: BatchPSO) -> None:
+    # listener FINISHED, mencetak nilai minimum setiap replika
+    for k in range(batch.n_replicas):
+        print(
+            f"c = {batch.c[k].tolist()}, w = {batch.w[k]}: "
+            f"gBest = {batch.g_best[k].tolist()}, f(gBest) = {batch.f_g_best[k]:.4f}"
+        )
+
+
+def main() -> None:
+    # sapuan c dan w untuk f(x) = x / (x^2 + 1) seperti pso_single_variable
+    c_values: np.ndarray = np.array([[0.5, 1.0], [1.0, 0.5], [1.5, 1.5]])
+    w_values: np.ndarray = np.array([1.0, 0.7, 0.4])
+    c, w = (
+        np.repeat(c_values, len(w_values), axis=0),
+        np.tile(w_values, len(c_values)),
+    )
+    batch: BatchPSO = BatchPSO(
+        [0.0, -3.0, -4.0], 0.0, c, None, w, seed=list(range(len(w)))
+    )
+    batch.events.subscribe(FINISHED, print_result)
+    batch.iterate(20)
+
+
+if __name__ == "__main__":
+    main()
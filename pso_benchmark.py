@@ -0,0 +1,321 @@
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable
+
+import numpy as np
+
+from pso_evaluation import batch_objective
+from pso_vectorized import PSO
+
+
+@batch_objective
+def sphere(positions: np.ndarray) -> np.ndarray:
+    return np.sum(positions**2, axis=1)
+
+
+@batch_objective
+def rosenbrock(positions: np.ndarray) -> np.ndarray:
+    return np.sum(
+        100.0 * (positions[:, 1:] - positions[:, :-1] ** 2) ** 2
+        + (1.0 - positions[:, :-1]) ** 2,
+        axis=1,
+    )
+
+
+@batch_objective
+def rastrigin(positions: np.ndarray) -> np.ndarray:
+    return 10.0 * positions.shape[1] + np.sum(
+        positions**2 - 10.0 * np.cos(2.0 * np.pi * positions), axis=1
+    )
+
+
+@batch_objective
+def ackley(positions: np.ndarray) -> np.ndarray:
+    return (
+        -20.0 * np.exp(-0.2 * np.sqrt(np.mean(positions**2, axis=1)))
+        - np.exp(np.mean(np.cos(2.0 * np.pi * positions), axis=1))
+        + 20.0
+        + np.e
+    )
+
+
+@batch_objective
+def griewank(positions: np.ndarray) -> np.ndarray:
+    i: np.ndarray = np.arange(1, positions.shape[1] + 1)
+    return (
+        np.sum(positions**2, axis=1) / 4000.0
+        - np.prod(np.cos(positions / np.sqrt(i)), axis=1)
+        + 1.0
+    )
+
+
+@batch_objective
+def quadratic(positions: np.ndarray) -> np.ndarray:
+    # fungsi objektif pso_multi_variable
+    x, y = positions.T
+    return 0.26 * (x**2 + y**2) - 0.48 * x * y
+
+
+@batch_objective
+def quadratic_2b(positions: np.ndarray) -> np.ndarray:
+    # fungsi objektif task_2a dan task_2b
+    x, y = positions.T
+    return 0.39 * (x**2 + y**2) - 0.56 * x * y
+
+
+@batch_objective
+def polynomial(positions: np.ndarray) -> np.ndarray:
+    # fungsi objektif task_1a dan task_1b
+    x: np.ndarray = positions[:, 0]
+    return (4.0 * x**2 + x - 2.0) ** 2
+
+
+@batch_objective
+def rational(positions: np.ndarray) -> np.ndarray:
+    # fungsi objektif pso_single_variable
+    x: np.ndarray = positions[:, 0]
+    return x / (x**2 + 1.0)
+
+
+@dataclass
+class Benchmark:
+    name: str
+    func: Callable[[np.ndarray], np.ndarray]
+    low: float
+    high: float
+    # jumlah dimensi tetap, None jika fungsi berlaku untuk dimensi berapa pun
+    n_dims: int | None = None
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    benchmark.name: benchmark
+    for benchmark in [
+        Benchmark("sphere", sphere, -5.12, 5.12),
+        Benchmark("rosenbrock", rosenbrock, -2.048, 2.048),
+        Benchmark("rastrigin", rastrigin, -5.12, 5.12),
+        Benchmark("ackley", ackley, -32.768, 32.768),
+        Benchmark("griewank", griewank, -600.0, 600.0),
+        Benchmark("quadratic", quadratic, -5.0, 5.0, 2),
+        Benchmark("quadratic_2b", quadratic_2b, -5.0, 5.0, 2),
+        Benchmark("polynomial", polynomial, -5.0, 5.0, 1),
+        Benchmark("rational", rational, -5.0, 5.0, 1),
+    ]
+}
+
+# parameter PSO yang sama untuk semua mesin
+C: list[float] = [1.5, 1.5]
+R: list[float] = [0.5, 0.5]
+W: float = 0.7
+
+
+# Pembungkus PSO berbasis loop (pso_single_variable, pso_multi_variable)
+class LegacyEngine:
+    def __init__(self, module, pso, evals_per_iteration: int) -> None:
+        """
+        Kelas lama tidak menghitung evaluasi f(x), sehingga jumlahnya dihitung
+        sekali di luar pengukuran waktu lalu dikalikan jumlah iterasi.
+        """
+        self.module = module
+        self.pso = pso
+        self.evals_per_iteration: int = evals_per_iteration
+        self.n_evals: int = 0
+
+    def iterate(self, n: int) -> None:
+        self.pso.iterate(n)
+        self.n_evals += n * self.evals_per_iteration
+
+    @property
+    def f_g_best(self) -> float:
+        return float(self.module.obj_func(*np.atleast_1d(self.pso.g_best)))
+
+
+def count_evals(module, make_pso: Callable[[], object]) -> int:
+    # menghitung evaluasi obj_func modul lama dalam satu iterasi
+    original: Callable[..., float] = module.obj_func
+    n_calls: list[int] = [0]
+
+    def counted(*args: float) -> float:
+        n_calls[0] += 1
+        return original(*args)
+
+    module.obj_func = counted
+    try:
+        make_pso().iterate(1)
+    finally:
+        module.obj_func = original
+    return n_calls[0]
+
+
+def vectorized_engine(benchmark: Benchmark, positions: np.ndarray, seed: int) -> PSO:
+    # mesin array pso_vectorized, r1 dan r2 acak per partikel dan dimensi
+    return PSO(positions, 0.0, C, None, W, benchmark.func, seed=seed)
+
+
+def vectorized_fixed_r_engine(
+    benchmark: Benchmark, positions: np.ndarray, seed: int
+) -> PSO:
+    # mesin array dengan r tetap, pekerjaannya setara dengan kelas lama
+    return PSO(positions, 0.0, C, R, W, benchmark.func, seed=seed)
+
+
+def single_variable_engine(
+    benchmark: Benchmark, positions: np.ndarray, seed: int
+) -> LegacyEngine:
+    # kelas loop pso_single_variable, hanya untuk f(x) = x/(x^2+1)
+    if benchmark.name != "rational":
+        raise ValueError("pso_single_variable hanya mendukung benchmark rational")
+    import pso_single_variable
+
+    def make_pso() -> object:
+        x: list[float] = positions[:, 0].tolist()
+        return pso_single_variable.PSO(x, [0.0] * len(x), C, R, W)
+
+    return LegacyEngine(
+        pso_single_variable, make_pso(), count_evals(pso_single_variable, make_pso)
+    )
+
+
+def multi_variable_engine(
+    benchmark: Benchmark, positions: np.ndarray, seed: int
+) -> LegacyEngine:
+    # kelas loop pso_multi_variable, hanya untuk f(x,y) quadratic
+    if benchmark.name != "quadratic":
+        raise ValueError("pso_multi_variable hanya mendukung benchmark quadratic")
+    import pso_multi_variable
+
+    def make_pso() -> object:
+        x, y = positions.T.tolist()
+        return pso_multi_variable.PSO(x, y, [0.0] * len(x), C, R, W)
+
+    return LegacyEngine(
+        pso_multi_variable, make_pso(), count_evals(pso_multi_variable, make_pso)
+    )
+
+
+# mesin yang dibandingkan: nama -> fungsi pembuat (benchmark, posisi awal, seed)
+# yang mengembalikan objek dengan iterate(n), n_evals dan f_g_best, atau
+# ValueError jika benchmark tidak didukung
+ENGINES: dict[str, Callable[[Benchmark, np.ndarray, int], object]] = {
+    "vectorized": vectorized_engine,
+    "vectorized_fixed_r": vectorized_fixed_r_engine,
+    "single_variable": single_variable_engine,
+    "multi_variable": multi_variable_engine,
+}
+
+
+@dataclass
+class Measurement:
+    engine: str
+    benchmark: str
+    n_particles: int
+    n_dims: int
+    n_iterations: int
+    seconds: float
+    iterations_per_second: float
+    evals_per_second: float
+    f_g_best: float
+
+
+def measure(
+    engine: str,
+    benchmark: Benchmark,
+    n_particles: int,
+    n_dims: int,
+    n_iterations: int,
+    repeats: int = 3,
+    seed: int = 0,
+) -> Measurement | None:
+    """
+    Mengukur waktu n_iterations iterasi satu mesin. Pembuatan swarm (termasuk
+    evaluasi posisi awal) tidak ikut diukur, dan dari beberapa pengulangan
+    diambil waktu tercepat karena paling sedikit terganggu proses lain.
+
+    Parameter:
+    - engine: Nama mesin di ENGINES
+    - benchmark: Fungsi uji
+    - n_particles: Jumlah partikel
+    - n_dims: Jumlah dimensi
+    - n_iterations: Jumlah iterasi yang diukur
+    - repeats: Jumlah pengulangan
+    - seed: Seed posisi awal dan bilangan acak, sama untuk setiap mesin
+
+    Mengembalikan None jika mesin tidak mendukung benchmark ini.
+    """
+    positions: np.ndarray = np.random.default_rng(seed).uniform(
+        benchmark.low, benchmark.high, (n_particles, n_dims)
+    )
+    best: float = np.inf
+    for _ in range(repeats):
+        try:
+            pso = ENGINES[engine](benchmark, positions.copy(), seed)
+        except ValueError:
+            return None
+        start_evals: int = pso.n_evals
+        start: float = time.perf_counter()
+        pso.iterate(n_iterations)
+        best = min(best, time.perf_counter() - start)
+        n_evals: int = pso.n_evals - start_evals
+    return Measurement(
+        engine,
+        benchmark.name,
+        n_particles,
+        n_dims,
+        n_iterations,
+        best,
+        n_iterations / best,
+        n_evals / best,
+        float(pso.f_g_best),
+    )
+
+
+def run(
+    engines: list[str],
+    benchmarks: list[str],
+    swarm_sizes: list[int],
+    dimensions: list[int],
+    n_iterations: int = 100,
+    repeats: int = 3,
+    seed: int = 0,
+) -> list[Measurement]:
+    """
+    Mengukur setiap kombinasi mesin, benchmark, jumlah partikel dan dimensi.
+    Benchmark berdimensi tetap hanya diukur pada dimensinya sendiri, dan
+    kombinasi yang tidak didukung suatu mesin dilewati.
+    """
+    measurements: list[Measurement] = []
+    for name in benchmarks:
+        benchmark: Benchmark = BENCHMARKS[name]
+        for n_dims in [benchmark.n_dims] if benchmark.n_dims else dimensions:
+            for n_particles in swarm_sizes:
+                for engine in engines:
+                    measurement: Measurement | None = measure(
+                        engine,
+                        benchmark,
+                        n_particles,
+                        n_dims,
+                        n_iterations,
+                        repeats,
+                        seed,
+                    )
+                    if measurement is not None:
+                        measurements.append(measurement)
+    return measurements
+
+
+def main() -> None:
+    # hasil dalam format JSON, satu objek per pengukuran
+    measurements: list[Measurement] = run(
+        list(ENGINES),
+        list(BENCHMARKS),
+        swarm_sizes=[10, 100, 1000],
+        dimensions=[2, 10, 30],
+        n_iterations=100,
+    )
+    json.dump([asdict(m) for m in measurements], sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable
+
+import numpy as np
+
+
+def batch_objective(func: Callable[[np.ndarray], np.ndarray]):
+    """
+    Menandai func sebagai fungsi objektif batch.
+
+    Fungsi batch menerima array posisi (n_particles, n_dims) dan
+    mengembalikan vektor fitness (n_particles,), sehingga PSO cukup
+    memanggilnya satu kali per iterasi.
+    """
+    func.batched = True
+    return func
+
+
+def vector_objective(func: Callable[[np.ndarray], float]):
+    """
+    Menandai func sebagai fungsi objektif skalar yang menerima satu vektor
+    posisi (n_dims,), bukan koordinat terpisah obj_func(x, y, ...). Cocok
+    untuk masalah dengan puluhan hingga ratusan dimensi.
+    """
+    func.unpack = False
+    return func
+
+
+class ScalarObjective:
+    """
+    Membungkus fungsi objektif skalar seperti obj_func(x) atau obj_func(x, y)
+    menjadi fungsi objektif batch. Setiap baris posisi dipanggil sebagai
+    func(*posisi), atau func(posisi) untuk fungsi vector_objective.
+    """
+
+    batched: bool = True
+
+    def __init__(self, func: Callable[..., float]) -> None:
+        self.func: Callable[..., float] = func
+        self.unpack: bool = getattr(func, "unpack", True)
+
+    def __call__(self, positions: np.ndarray) -> np.ndarray:
+        if not self.unpack:
+            return np.array(
+                [self.func(position) for position in positions], dtype=np.float64
+            )
+        return np.array(
+            [self.func(*position) for position in positions], dtype=np.float64
+        )
+
+
+def as_batch_objective(func: Callable) -> Callable[[np.ndarray], np.ndarray]:
+    # fungsi yang sudah batch dipakai langsung, fungsi skalar dibungkus
+    return func if getattr(func, "batched", False) else ScalarObjective(func)
+
+
+class ProcessPoolEvaluator:
+    """
+    Mengevaluasi fungsi objektif batch secara paralel dengan
+    ProcessPoolExecutor. Posisi dibagi menjadi potongan berisi chunksize
+    partikel, dan hasilnya digabung kembali sesuai urutan partikel sehingga
+    sama persis dengan evaluasi serial.
+
+    Parameter:
+    - func: Fungsi objektif batch, harus bisa di-pickle (fungsi level modul)
+    - workers: Jumlah proses worker, default os.cpu_count()
+    - chunksize: Jumlah partikel per tugas, default dibagi rata ke worker
+    """
+
+    batched: bool = True
+
+    def __init__(
+        self,
+        func: Callable[[np.ndarray], np.ndarray],
+        workers: int | None = None,
+        chunksize: int | None = None,
+    ) -> None:
+        self.func: Callable[[np.ndarray], np.ndarray] = func
+        self.workers: int = workers or os.cpu_count() or 1
+        self.chunksize: int | None = chunksize
+        self.executor: ProcessPoolExecutor = ProcessPoolExecutor(self.workers)
+
+    def __call__(self, positions: np.ndarray) -> np.ndarray:
+        chunksize: int = self.chunksize or max(1, -(-len(positions) // self.workers))
+        chunks: list[np.ndarray] = [
+            positions[i : i + chunksize] for i in range(0, len(positions), chunksize)
+        ]
+        return np.concatenate(
+            [
+                np.asarray(f, dtype=np.float64)
+                for f in self.executor.map(self.func, chunks)
+            ]
+        )
+
+    def close(self) -> None:
+        self.executor.shutdown()
+
+    def __enter__(self) -> "ProcessPoolEvaluator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# state worker SharedMemoryEvaluator, diisi sekali oleh initializer
+_shared_func: Callable[[np.ndarray], np.ndarray] | None = None
+_shared_blocks: dict[str, SharedMemory] = {}
+
+
+def _init_shared_worker(func: Callable[[np.ndarray], np.ndarray]) -> None:
+    global _shared_func
+    _shared_func = func
+
+
+def _attach(names: tuple[str, str]) -> list[SharedMemory]:
+    # blok yang sudah dibuka dipakai ulang. Evaluator memakai dua pasang
+    # blok (swarm dan scratch), blok lain yang sudah tidak dipakai ditutup
+    missing: list[str] = [name for name in names if name not in _shared_blocks]
+    if missing and len(_shared_blocks) + len(missing) > 4:
+        for name in [name for name in _shared_blocks if name not in names]:
+            _shared_blocks.pop(name).close()
+    for name in missing:
+        _shared_blocks[name] = SharedMemory(name)
+    return [_shared_blocks[name] for name in names]
+
+
+def _evaluate_shared(
+    names: tuple[str, str],
+    shape: tuple[int, int],
+    dtype: str,
+    start: int,
+    stop: int,
+) -> None:
+    # membaca posisi start:stop langsung dari shared memory dan menulis
+    # fitness-nya di tempat, tidak ada array yang dikirim lewat pipe
+    positions_block, fitness_block = _attach(names)
+    positions: np.ndarray = np.ndarray(shape, dtype=dtype, buffer=positions_block.buf)
+    fitness: np.ndarray = np.ndarray(
+        shape[0], dtype=np.float64, buffer=fitness_block.buf
+    )
+    fitness[start:stop] = _shared_func(positions[start:stop])
+
+
+class SharedMemoryEvaluator:
+    """
+    Seperti ProcessPoolEvaluator, tetapi posisi dan fitness disimpan di
+    multiprocessing.shared_memory. Worker membaca potongan posisinya sendiri
+    dan menulis fitness langsung ke array bersama, sehingga yang dikirim ke
+    worker setiap iterasi hanya nama blok dan rentang indeks, bukan salinan
+    posisi hasil pickle.
+
+    Array dari share() (misalnya PSO.x) menempati blok swarm sendiri dan
+    dievaluasi tanpa penyalinan. Posisi lain, misalnya sebagian posisi dari
+    MemoizedObjective atau SurrogateEvaluator yang membungkus evaluator ini,
+    disalin ke blok scratch terpisah, sehingga blok swarm tidak pernah
+    ditimpa.
+
+    Parameter:
+    - func: Fungsi objektif batch, harus bisa di-pickle (fungsi level modul),
+      dikirim satu kali ke setiap worker
+    - workers: Jumlah proses worker, default os.cpu_count()
+    - chunksize: Jumlah partikel per tugas, default dibagi rata ke worker
+    """
+
+    batched: bool = True
+
+    def __init__(
+        self,
+        func: Callable[[np.ndarray], np.ndarray],
+        workers: int | None = None,
+        chunksize: int | None = None,
+    ) -> None:
+        self.func: Callable[[np.ndarray], np.ndarray] = func
+        self.workers: int = workers or os.cpu_count() or 1
+        self.chunksize: int | None = chunksize
+        self.executor: ProcessPoolExecutor = ProcessPoolExecutor(
+            self.workers, initializer=_init_shared_worker, initargs=(func,)
+        )
+        # pasangan blok [posisi, fitness] untuk array dari share() dan untuk
+        # posisi lain
+        self.blocks: list[SharedMemory] = []
+        self.scratch: list[SharedMemory] = []
+        self.positions: np.ndarray = np.empty((0, 0))
+
+    @staticmethod
+    def allocate(positions: np.ndarray) -> list[SharedMemory]:
+        # membuat pasangan blok [posisi, fitness] yang cukup untuk positions
+        return [
+            SharedMemory(create=True, size=max(positions.nbytes, 1)),
+            SharedMemory(create=True, size=max(len(positions) * 8, 1)),
+        ]
+
+    @staticmethod
+    def fits(blocks: list[SharedMemory], positions: np.ndarray) -> bool:
+        return (
+            bool(blocks)
+            and blocks[0].size >= positions.nbytes
+            and blocks[1].size >= len(positions) * 8
+        )
+
+    @staticmethod
+    def unlink(blocks: list[SharedMemory]) -> None:
+        # array yang masih dipegang di luar tetap bisa dipakai, memorinya
+        # dibebaskan setelah array itu tidak lagi direferensikan
+        for block in blocks:
+            try:
+                block.close()
+            except BufferError:
+                pass
+            block.unlink()
+
+    def share(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Menyalin positions ke blok swarm yang baru dan mengembalikan array
+        yang menempati blok tersebut. Jika array ini diubah di tempat
+        (misalnya x += v) lalu dievaluasi, tidak ada penyalinan sama sekali.
+        """
+        self.unlink(self.blocks)
+        self.blocks = self.allocate(positions)
+        self.positions = np.ndarray(
+            positions.shape, dtype=positions.dtype, buffer=self.blocks[0].buf
+        )
+        self.positions[:] = positions
+        return self.positions
+
+    def __call__(self, positions: np.ndarray) -> np.ndarray:
+        blocks: list[SharedMemory] = self.blocks
+        if positions is not self.positions:
+            if not self.fits(self.scratch, positions):
+                self.unlink(self.scratch)
+                self.scratch = self.allocate(positions)
+            blocks = self.scratch
+            scratch: np.ndarray = np.ndarray(
+                positions.shape, dtype=positions.dtype, buffer=blocks[0].buf
+            )
+            scratch[:] = positions
+        n_particles: int = len(positions)
+        chunksize: int = self.chunksize or max(1, -(-n_particles // self.workers))
+        tasks: list[tuple] = [
+            (
+                (blocks[0].name, blocks[1].name),
+                positions.shape,
+                positions.dtype.str,
+                start,
+                min(start + chunksize, n_particles),
+            )
+            for start in range(0, n_particles, chunksize)
+        ]
+        # list() menunggu seluruh tugas dan meneruskan exception dari worker
+        list(self.executor.map(_evaluate_shared, *zip(*tasks)))
+        # disalin karena isi fitness ditimpa pada panggilan berikutnya
+        return np.ndarray(n_particles, dtype=np.float64, buffer=blocks[1].buf).copy()
+
+    def release(self) -> None:
+        # melepas seluruh blok shared memory
+        self.positions = np.empty((0, 0))
+        self.unlink(self.blocks)
+        self.unlink(self.scratch)
+        self.blocks, self.scratch = [], []
+
+    def close(self) -> None:
+        self.executor.shutdown()
+        self.release()
+
+    def __enter__(self) -> "SharedMemoryEvaluator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
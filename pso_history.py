@@ -0,0 +1,205 @@
+import numpy as np
+
+MODES: tuple[str, ...] = ("full", "g_best", "ring")
+
+# batas memori yang dialokasikan reserve() di awal iterate
+RESERVE_BYTES: int = 64 * 2**20
+
+
+# Perekam riwayat iterasi PSO dengan array yang dialokasikan di awal
+class History:
+    def __init__(
+        self,
+        mode: str = "full",
+        every: int = 1,
+        capacity: int | None = None,
+        dtype: type = np.float64,
+    ) -> None:
+        """
+        Inisialisasi perekam riwayat. Riwayat disimpan dalam array bertipe
+        tetap, bukan list salinan per iterasi.
+
+        Parameter:
+        - mode: "full" menyimpan x, pBest, v dan f(x) seluruh partikel,
+          "g_best" hanya menyimpan gBest dan f(gBest), "ring" sama seperti
+          "full" tetapi hanya capacity rekaman terakhir
+        - every: Hanya merekam setiap iterasi ke-N
+        - capacity: Jumlah rekaman pada mode "ring"
+        - dtype: Tipe data posisi dan velocity yang disimpan
+        """
+        if mode not in MODES:
+            raise ValueError(f"mode riwayat tidak dikenal: {mode}")
+        if mode == "ring" and not capacity:
+            raise ValueError("mode ring membutuhkan capacity")
+        self.mode: str = mode
+        self.every: int = every
+        self.capacity: int = capacity or 0
+        self.dtype: type = dtype
+
+        # jumlah rekaman yang pernah ditulis, termasuk yang sudah tertimpa
+        self.count: int = 0
+        self.arrays: dict[str, np.ndarray] = {}
+
+    def shapes(self, n_particles: int, n_dims: int) -> dict[str, tuple]:
+        shapes: dict[str, tuple] = {
+            "iteration": (),
+            "g_best": (n_dims,),
+            "f_g_best": (),
+        }
+        if self.mode != "g_best":
+            shapes |= {
+                "x": (n_particles, n_dims),
+                "p_best": (n_particles, n_dims),
+                "v": (n_particles, n_dims),
+                "f_x": (n_particles,),
+            }
+        return shapes
+
+    def allocate(self, size: int, n_particles: int, n_dims: int) -> None:
+        # memperbesar array menjadi size rekaman, isi lama tetap disalin
+        for name, shape in self.shapes(n_particles, n_dims).items():
+            dtype = (
+                np.int64
+                if name == "iteration"
+                else np.float64 if name.startswith("f_") else self.dtype
+            )
+            array: np.ndarray = np.empty((size, *shape), dtype=dtype)
+            if name in self.arrays:
+                array[: self.count] = self.arrays[name][: self.count]
+            self.arrays[name] = array
+
+    def reserve(
+        self, iteration: int, n_iterations: int, n_particles: int, n_dims: int
+    ) -> None:
+        """
+        Mengalokasikan tempat untuk n_iterations iterasi berikutnya sekaligus,
+        paling banyak RESERVE_BYTES, sehingga run pendek tidak mengalokasikan
+        apa pun di dalam loop iterasi. n_iterations yang sangat besar (misalnya
+        dengan kriteria berhenti lebih awal) tidak langsung memakan memori;
+        jika tempatnya habis, record() memperbesar array dua kali lipat.
+        """
+        if self.mode == "ring":
+            size: int = self.capacity
+        else:
+            upcoming: int = (iteration + n_iterations) // self.every - (
+                iteration // self.every
+            )
+            record_bytes: int = sum(
+                8 * int(np.prod(shape))
+                for shape in self.shapes(n_particles, n_dims).values()
+            )
+            size = self.count + min(upcoming, max(RESERVE_BYTES // record_bytes, 1))
+        if not self.arrays or len(self.arrays["iteration"]) < size:
+            self.allocate(size, n_particles, n_dims)
+
+    def record(self, iteration: int, pso) -> None:
+        # menyimpan state pso pada iterasi ini jika termasuk iterasi ke-N
+        if iteration % self.every:
+            return
+        if not self.arrays or (
+            self.mode != "ring" and self.count >= len(self.arrays["iteration"])
+        ):
+            self.allocate(max(2 * self.count, self.capacity, 1), *pso.x.shape)
+
+        i: int = self.count % len(self.arrays["iteration"])
+        self.arrays["iteration"][i] = iteration
+        self.arrays["g_best"][i] = pso.g_best
+        self.arrays["f_g_best"][i] = pso.f_g_best
+        if self.mode != "g_best":
+            # x yang disimpan adalah posisi yang dievaluasi pada iterasi ini
+            self.arrays["x"][i] = pso.old_x
+            self.arrays["p_best"][i] = pso.p_best
+            self.arrays["v"][i] = pso.v
+            self.arrays["f_x"][i] = pso.f_old_x
+        self.count += 1
+
+    def state(self) -> dict[str, np.ndarray]:
+        # seluruh isi perekam sebagai array, untuk disimpan ke file .npz
+        state: dict[str, np.ndarray] = {
+            "history_mode": np.array(self.mode),
+            "history_every": np.array(self.every),
+            "history_capacity": np.array(self.capacity),
+            "history_dtype": np.array(np.dtype(self.dtype).str),
+            "history_count": np.array(self.count),
+        }
+        for name, array in self.arrays.items():
+            state[f"history_{name}"] = array[: min(self.count, len(array))]
+        return state
+
+    @classmethod
+    def from_state(cls, state) -> "History":
+        # kebalikan dari state(), state boleh berupa hasil numpy.load
+        history: History = cls(
+            str(state["history_mode"]),
+            int(state["history_every"]),
+            int(state["history_capacity"]) or None,
+            np.dtype(str(state["history_dtype"])).type,
+        )
+        history.count = int(state["history_count"])
+        for key in state:
+            if key.startswith("history_") and state[key].ndim > 0:
+                array: np.ndarray = state[key]
+                if history.mode == "ring":
+                    array = np.resize(array, (history.capacity, *array.shape[1:]))
+                history.arrays[key.removeprefix("history_")] = array.copy()
+        return history
+
+    def save(self, path: str) -> None:
+        # menyimpan riwayat ke file .npz agar bisa diplot tanpa menjalankan PSO
+        with open(path, "wb") as file:
+            np.savez(file, **self.state())
+
+    @classmethod
+    def load(cls, path: str) -> "History":
+        """
+        Membaca riwayat dari file hasil save(), atau dari checkpoint
+        PSO.save() yang juga menyimpan riwayat.
+        """
+        with np.load(path) as data:
+            return cls.from_state(data)
+
+    def __len__(self) -> int:
+        if self.mode == "ring":
+            return min(self.count, self.capacity)
+        return self.count
+
+    def get(self, name: str) -> np.ndarray:
+        """
+        Mengembalikan riwayat name (iteration, x, p_best, v, f_x, g_best,
+        f_g_best) berurutan dari rekaman terlama.
+        """
+        if name not in self.arrays:
+            return np.empty(0)
+        array: np.ndarray = self.arrays[name]
+        if self.mode == "ring" and self.count > self.capacity:
+            start: int = self.count % self.capacity
+            return np.concatenate([array[start:], array[:start]])
+        return array[: len(self)]
+
+    @property
+    def iterations(self) -> np.ndarray:
+        return self.get("iteration")
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.get("x")
+
+    @property
+    def p_best(self) -> np.ndarray:
+        return self.get("p_best")
+
+    @property
+    def v(self) -> np.ndarray:
+        return self.get("v")
+
+    @property
+    def f_x(self) -> np.ndarray:
+        return self.get("f_x")
+
+    @property
+    def g_best(self) -> np.ndarray:
+        return self.get("g_best")
+
+    @property
+    def f_g_best(self) -> np.ndarray:
+        return self.get("f_g_best")
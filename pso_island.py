@@ -0,0 +1,271 @@
+import multiprocessing as mp
+import queue
+from typing import Callable
+
+import numpy as np
+
+from events import BEST_IMPROVED, FINISHED, Events
+from pso_evaluation import batch_objective
+from pso_vectorized import PSO, spawn_rngs
+
+
+@batch_objective
+def obj_func(positions: np.ndarray) -> np.ndarray:
+    # fungsi Rastrigin, banyak minimum lokal
+    return 10.0 * positions.shape[1] + np.sum(
+        positions**2 - 10.0 * np.cos(2.0 * np.pi * positions), axis=1
+    )
+
+
+def neighbors(n_islands: int, topology: str) -> list[list[int]]:
+    """
+    Menentukan pulau tujuan migrasi untuk setiap pulau.
+
+    Parameter:
+    - n_islands: Jumlah pulau (sub-swarm)
+    - topology: "ring" (ke pulau berikutnya) atau "full" (ke semua pulau lain)
+    """
+    if topology == "ring":
+        return [
+            [(i + 1) % n_islands] if n_islands > 1 else [] for i in range(n_islands)
+        ]
+    if topology == "full":
+        return [[j for j in range(n_islands) if j != i] for i in range(n_islands)]
+    raise ValueError(f"topologi migrasi tidak dikenal: {topology}")
+
+
+def emigrants(pso: PSO, n_migrants: int) -> tuple[np.ndarray, np.ndarray]:
+    # mengambil pBest terbaik sebanyak n_migrants beserta fitness-nya
+    best: np.ndarray = np.argsort(pso.f_p_best, kind="stable")[:n_migrants]
+    return pso.p_best[best].copy(), pso.f_p_best[best].copy()
+
+
+def accept_migrants(pso: PSO, positions: np.ndarray, fitness: np.ndarray) -> None:
+    """
+    Mengganti partikel terburuk dengan partikel pendatang. Fitness pendatang
+    sudah diketahui, sehingga tidak perlu dievaluasi ulang.
+    """
+    pso.update_fitness()
+    worst: np.ndarray = np.argsort(pso.f_x, kind="stable")[::-1][: len(positions)]
+    pso.x[worst] = positions
+    pso.old_x[worst] = positions
+    pso.f_x[worst] = fitness
+    pso.f_old_x[worst] = fitness
+    minimum_index: int = int(np.argmin(fitness))
+    if fitness[minimum_index] < pso.f_g_best:
+        pso.g_best = positions[minimum_index].copy()
+        pso.f_g_best = float(fitness[minimum_index])
+        pso.events.emit(BEST_IMPROVED, pso)
+
+
+def run_island(
+    index: int,
+    pso: PSO,
+    n: int,
+    interval: int,
+    n_migrants: int,
+    inbox: mp.Queue,
+    outboxes: list[mp.Queue],
+    results: mp.Queue,
+) -> None:
+    """
+    Dijalankan di proses terpisah: iterasi lokal, lalu migrasi tiap interval.
+
+    Jika pulau ini gagal, error-nya dikirim ke results dan pesan berhenti
+    (epoch None) dikirim ke setiap tetangga, sehingga tidak ada proses yang
+    menunggu selamanya. Tetangga yang menerima pesan berhenti keluar tanpa
+    mengirim hasil; proses utama lalu menghentikan seluruh pulau.
+    """
+    try:
+        pending: list[tuple[int, int, np.ndarray, np.ndarray]] = []
+        done: int = 0
+        epoch: int = 0
+        while done < n:
+            for _ in range(min(interval, n - done)):
+                pso.step()
+            done += min(interval, n - done)
+            if done >= n or not outboxes:
+                continue
+
+            positions, fitness = emigrants(pso, n_migrants)
+            for outbox in outboxes:
+                outbox.put((epoch, index, positions, fitness))
+
+            # setiap pulau menunggu kiriman dari tetangganya saja, bukan dari
+            # seluruh swarm, kiriman epoch berikutnya disimpan lebih dulu
+            while sum(message[0] == epoch for message in pending) < len(outboxes):
+                message = inbox.get()
+                if message[0] is None:
+                    return
+                pending.append(message)
+            arrived: list[tuple[int, int, np.ndarray, np.ndarray]] = sorted(
+                (message for message in pending if message[0] == epoch),
+                key=lambda message: message[1],
+            )
+            pending = [message for message in pending if message[0] != epoch]
+            # diurutkan menurut pulau asal agar hasil tidak bergantung pada
+            # urutan kedatangan antar proses
+            for _, _, positions, fitness in arrived:
+                accept_migrants(pso, positions, fitness)
+            epoch += 1
+
+        # state pulau dikirim kembali agar iterate berikutnya bisa melanjutkan
+        results.put((index, pso, None))
+    except Exception as error:
+        results.put((index, None, error))
+        for outbox in outboxes:
+            outbox.put((None, index, None, None))
+        # exit code bukan 0 tetap terlihat oleh proses utama walaupun error
+        # tidak bisa di-pickle
+        raise
+
+
+# Model pulau (island model): beberapa sub-swarm PSO berjalan paralel
+class IslandPSO:
+    def __init__(
+        self,
+        n_islands: int,
+        n_particles: int,
+        bounds: list[tuple[float, float]],
+        c: list[float],
+        r: list[float] | None,
+        w: float,
+        obj_func: Callable = obj_func,
+        interval: int = 10,
+        n_migrants: int = 1,
+        topology: str = "ring",
+        seed: int | None = None,
+    ) -> None:
+        """
+        Inisialisasi model pulau. Setiap pulau adalah PSO dari
+        pso_vectorized yang berjalan di prosesnya sendiri, dan setiap
+        interval iterasi partikel terbaiknya dikirim ke pulau tetangga.
+
+        Parameter:
+        - n_islands: Jumlah pulau, biasanya sama dengan jumlah core
+        - n_particles: Jumlah partikel per pulau
+        - bounds: Batas posisi awal [(min, max), ...] untuk setiap dimensi
+        - c: List koefisien percepatan [c1, c2]
+        - r: List bilangan acak [r1, r2], atau None untuk r1 dan r2 acak
+        - w: Inertia weight
+        - obj_func: Fungsi objektif, harus bisa di-pickle
+        - interval: Jumlah iterasi antar migrasi (K)
+        - n_migrants: Jumlah partikel terbaik yang dikirim setiap migrasi
+        - topology: "ring" atau "full"
+        - seed: Seed untuk posisi awal dan bilangan acak setiap pulau, setiap
+          pulau mendapat aliran acak turunan yang independen
+        """
+        self.topology: list[list[int]] = neighbors(n_islands, topology)
+        self.interval: int = interval
+        self.n_migrants: int = n_migrants
+        # listener FINISHED menerima objek IslandPSO ini
+        self.events: Events = Events()
+
+        low, high = np.array(bounds, dtype=np.float64).T
+        self.islands: list[PSO] = []
+        for rng in spawn_rngs(seed, n_islands):
+            x: np.ndarray = rng.uniform(low, high, (n_particles, len(low)))
+            self.islands.append(PSO(x, 0.0, c, r, w, obj_func, seed=rng))
+
+        best: PSO = min(self.islands, key=lambda p: p.f_g_best)
+        self.g_best: np.ndarray = best.g_best
+        self.f_g_best: float = best.f_g_best
+        self.island_f_g_best: list[float] = [p.f_g_best for p in self.islands]
+        self.n_evals: int = sum(p.n_evals for p in self.islands)
+
+    @staticmethod
+    def receive(results: mp.Queue, processes: list[mp.Process]) -> tuple[int, PSO]:
+        """
+        Mengambil satu hasil pulau. Error dari pulau dilempar ulang di sini,
+        dan pulau yang mati tanpa mengirim hasil (misalnya dihentikan sistem)
+        dideteksi dari exit code-nya.
+        """
+        failed: bool = False
+        while True:
+            try:
+                index, pso, error = results.get(timeout=1.0)
+            except queue.Empty:
+                # satu putaran tambahan untuk hasil yang dikirim tepat
+                # sebelum prosesnya keluar
+                if failed:
+                    raise RuntimeError("proses pulau berhenti tanpa mengirim hasil")
+                failed = any(process.exitcode not in (None, 0) for process in processes)
+                continue
+            if error is not None:
+                raise error
+            return index, pso
+
+    def iterate(self, n: int) -> None:
+        # menjalankan setiap pulau sebanyak n iterasi secara paralel
+        inboxes: list[mp.Queue] = [mp.Queue() for _ in self.islands]
+        results: mp.Queue = mp.Queue()
+        processes: list[mp.Process] = [
+            mp.Process(
+                target=run_island,
+                args=(
+                    i,
+                    pso,
+                    n,
+                    self.interval,
+                    self.n_migrants,
+                    inboxes[i],
+                    [inboxes[j] for j in self.topology[i]],
+                    results,
+                ),
+            )
+            for i, pso in enumerate(self.islands)
+        ]
+        for process in processes:
+            process.start()
+        try:
+            # hasil diambil sebelum join agar proses tidak tertahan di antrian
+            for _ in processes:
+                index, pso = self.receive(results, processes)
+                self.islands[index] = pso
+        except BaseException:
+            for process in processes:
+                process.terminate()
+            raise
+        finally:
+            for process in processes:
+                process.join()
+
+        best: PSO = min(self.islands, key=lambda p: p.f_g_best)
+        self.g_best, self.f_g_best = best.g_best, best.f_g_best
+        self.island_f_g_best = [p.f_g_best for p in self.islands]
+        self.n_evals = sum(p.n_evals for p in self.islands)
+        self.events.emit(FINISHED, self)
+
+
+def print_result(island_pso: IslandPSO) -> None:
+    # listener FINISHED yang mencetak hasil akhir setiap pulau
+    print(f"nilai minimum dari f(x) setiap pulau = {island_pso.island_f_g_best}")
+    print(f"nilai minimum dari f(x) adalah {island_pso.f_g_best:.4f}")
+    print(f"jumlah evaluasi f(x) = {island_pso.n_evals}")
+
+
+def main() -> None:
+    n_islands: int = mp.cpu_count()
+    n_particles: int = 50
+    bounds: list[tuple[float, float]] = [(-5.12, 5.12)] * 10
+    c_1: float = 1.5
+    c_2: float = 1.5
+    w: float = 0.7
+    island_pso: IslandPSO = IslandPSO(
+        n_islands,
+        n_particles,
+        bounds,
+        [c_1, c_2],
+        None,
+        w,
+        interval=10,
+        n_migrants=2,
+        topology="ring",
+        seed=0,
+    )
+    island_pso.events.subscribe(FINISHED, print_result)
+    island_pso.iterate(200)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+import numpy as np
+
+from pso_evaluation import ProcessPoolEvaluator, as_batch_objective
+from pso_vectorized import PSO
+
+
+def obj_func(x: float) -> float:
+    # fungsi objektif pso_single_variable yang dianggap mahal
+    time.sleep(0.001)
+    return round(x / ((x**2) + 1.0), 4)
+
+
+# Cache f(x) untuk posisi yang dibulatkan, dengan batas ukuran LRU
+class MemoizedObjective:
+    """
+    Membungkus fungsi objektif atau evaluator batch. Posisi dibulatkan ke
+    kelipatan resolution, dan posisi yang hasil pembulatannya pernah
+    dievaluasi memakai f(x) yang tersimpan, tanpa memanggil fungsi asli.
+    Jika cache melebihi maxsize, entri yang paling lama tidak dipakai
+    dibuang (LRU).
+
+    Karena kuncinya dibulatkan, nilai yang dikembalikan adalah f(x) dari
+    posisi yang berjarak kurang dari resolution/2 per dimensi. Untuk fungsi
+    yang hasilnya memang dibulatkan, pilih resolution yang cukup kecil agar
+    perbedaan ini tidak terlihat.
+
+    Cache hanya hidup di satu proses. Untuk evaluasi paralel, cache tetap
+    berada di proses utama di depan evaluator paralel: pasang dengan
+    use_memo(pso) lalu jalankan pso.iterate(n, workers=...), yang memasang
+    evaluator paralel di atribut func pembungkus ini, sehingga worker hanya
+    menerima posisi yang belum ada di cache. Salinan yang dikirim ke
+    proses lain (pickle) dimulai dengan cache kosong. Akses dari beberapa
+    thread dilindungi lock.
+
+    Parameter:
+    - func: Fungsi objektif skalar atau batch, atau evaluator batch
+    - resolution: Ukuran pembulatan posisi
+    - maxsize: Jumlah entri maksimum di cache
+    """
+
+    batched: bool = True
+
+    def __init__(
+        self,
+        func: Callable,
+        resolution: float = 1e-6,
+        maxsize: int = 100_000,
+    ) -> None:
+        self.func: Callable[[np.ndarray], np.ndarray] = as_batch_objective(func)
+        self.resolution: float = resolution
+        self.maxsize: int = maxsize
+        self.cache: OrderedDict[bytes, float] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.lock: threading.Lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        return self.__dict__ | {"cache": OrderedDict(), "lock": None}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__ = state | {"lock": threading.Lock()}
+
+    def keys(self, positions: np.ndarray) -> list[bytes]:
+        # kunci cache setiap baris: indeks grid hasil pembulatan
+        grid: np.ndarray = np.round(positions / self.resolution).astype(np.int64)
+        return [row.tobytes() for row in grid]
+
+    def __call__(self, positions: np.ndarray) -> np.ndarray:
+        keys: list[bytes] = self.keys(positions)
+        fitness: np.ndarray = np.empty(len(positions), dtype=np.float64)
+        # posisi yang belum ada di cache, kunci yang sama hanya dievaluasi sekali
+        missing: dict[bytes, list[int]] = {}
+        with self.lock:
+            for i, key in enumerate(keys):
+                value: float | None = self.cache.get(key)
+                if value is None:
+                    missing.setdefault(key, []).append(i)
+                else:
+                    self.cache.move_to_end(key)
+                    fitness[i] = value
+            self.hits += len(keys) - len(missing)
+            self.misses += len(missing)
+        if not missing:
+            return fitness
+
+        first: list[int] = [indices[0] for indices in missing.values()]
+        values: np.ndarray = np.asarray(
+            self.func(positions[first]), dtype=np.float64
+        ).reshape(len(first))
+        with self.lock:
+            for (key, indices), value in zip(missing.items(), values):
+                fitness[indices] = value
+                self.cache[key] = float(value)
+                self.cache.move_to_end(key)
+            while len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+                self.evictions += 1
+        return fitness
+
+    def stats(self) -> dict[str, float]:
+        # statistik cache: hits, misses, evictions, size dan hit_rate
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.cache),
+            "hit_rate": self.hits / max(self.hits + self.misses, 1),
+        }
+
+
+def use_memo(pso: PSO, **kwargs) -> MemoizedObjective:
+    """
+    Memasang MemoizedObjective di depan evaluator pso, termasuk evaluator
+    paralel yang sudah dipasang. pso.n_evals tetap menghitung seluruh posisi;
+    jumlah evaluasi asli ada di misses.
+    """
+    memo: MemoizedObjective = MemoizedObjective(pso.evaluator, **kwargs)
+    pso.evaluator = memo
+    return memo
+
+
+def main() -> None:
+    rng: np.random.Generator = np.random.default_rng(0)
+    pso: PSO = PSO(rng.uniform(-5.0, 5.0, 20), 0.0, [1.0, 0.5], None, 0.7, obj_func)
+    pool: ProcessPoolEvaluator = ProcessPoolEvaluator(pso.obj_func, workers=2)
+    pso.evaluator = pool
+    memo: MemoizedObjective = use_memo(pso, resolution=1e-4)
+    start: float = time.perf_counter()
+    result = pso.iterate(100)
+    pool.close()
+    print(f"nilai minimum dari f(x) adalah {result.f_g_best}")
+    print(f"{memo.stats()}, {time.perf_counter() - start:.2f} detik")
+
+
+if __name__ == "__main__":
+    main()
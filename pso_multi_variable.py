@@ -1,3 +1,6 @@
+from events import BEST_IMPROVED, FINISHED, ITERATION_END, ITERATION_START, Events
+
+
 def obj_func(x: float, y: float) -> float:
     return 0.26 * (x**2 + y**2) - 0.48 * x * y
 
@@ -18,6 +21,9 @@ class PSO:
         self.c: list[float] = c
         self.r: list[float] = r
         self.w: float = w
+        # jumlah iterasi yang sudah selesai, dibaca oleh listener
+        self.iteration: int = 0
+        self.events: Events = Events()
 
         self.old_x: list[float] = x.copy()
         self.old_y: list[float] = y.copy()
@@ -45,12 +51,11 @@ class PSO:
     def find_g_best(self) -> None:
         fValues = [obj_func(x, y) for x, y in zip(self.x, self.y)]
         minimumIndex = fValues.index(min(fValues))
-        self.g_best = (
-            [self.x[minimumIndex], self.y[minimumIndex]]
-            if obj_func(self.x[minimumIndex], self.y[minimumIndex])
-            < obj_func(self.g_best[0], self.g_best[1])
-            else self.g_best
-        )
+        if obj_func(self.x[minimumIndex], self.y[minimumIndex]) < obj_func(
+            self.g_best[0], self.g_best[1]
+        ):
+            self.g_best = [self.x[minimumIndex], self.y[minimumIndex]]
+            self.events.emit(BEST_IMPROVED, self)
 
     def update_velocities(self) -> None:
         for i, (x, y) in enumerate(zip(self.x, self.y)):
@@ -71,55 +76,80 @@ class PSO:
             self.x[i], self.y[i] = x + self.v[i][0], y + self.v[i][1]
 
     def iterate(self, n) -> None:
-        print(
-            f"""Iterasi ke-0
-nilai (x,y) = {list(zip(self.x, self.y))}
-nilai (vx,vy) = {self.v}
-nilai c = {self.c}
-nilai r = {self.r}
-nilai w = {self.w}
-"""
-        )
-        for i in range(n):
+        for _ in range(n):
+            self.events.emit(ITERATION_START, self)
             self.find_p_best()
             self.find_g_best()
             self.update_velocities()
             self.update_particles()
-            print(
-                f"""Iterasi ke-{i+1}
-1.) menentukan (x,y) = {list(zip(self.old_x, self.old_y))}
-2.) menentukan f(x,y) = {[round(obj_func(x, y),4) for x, y in zip(self.old_x, self.old_y)]}
-3.) menentukan gBest = {self.g_best}
-4.) menentukan pBest = {self.p_best}
-5.) menentukan (vx,vy) = {self.v}
-6.) update (x,y) = {list(zip(self.x, self.y))}\n"""
-            )
+            self.iteration += 1
+            self.events.emit(ITERATION_END, self)
+        self.events.emit(FINISHED, self)
+
+
+def print_parameters(pso: PSO) -> None:
+    # listener ITERATION_START, mencetak nilai awal sebelum iterasi pertama
+    if pso.iteration == 0:
         print(
-            f"Nilai minimum dari f(x,y) adalah {obj_func(self.g_best[0], self.g_best[1]):.4f}"
+            f"""Iterasi ke-0
+nilai (x,y) = {list(zip(pso.x, pso.y))}
+nilai (vx,vy) = {pso.v}
+nilai c = {pso.c}
+nilai r = {pso.r}
+nilai w = {pso.w}
+"""
         )
 
 
-x_0, y_0 = 1.0, 1.0
-x_1, y_1 = -2.0, -1.0
-x_2, y_2 = 2.0, 2.0
-v_0 = 0.0
-c_1 = 1.0
-c_2 = 0.5
-r_1 = 1.0
-r_2 = 1.0
-w = 1.0
-
-particles_x, particles_y = [x_0, x_1, x_2], [y_0, y_1, y_2]
-velocities = [v_0 for _ in range(len(particles_x))]
-acceleration_coefficients = [c_1, c_2]
-random_numbers = [r_1, r_2]
-inertia_weight = w
-pso = PSO(
-    particles_x,
-    particles_y,
-    velocities,
-    acceleration_coefficients,
-    random_numbers,
-    inertia_weight,
-)
-pso.iterate(3)
+def print_iteration(pso: PSO) -> None:
+    # listener ITERATION_END, mencetak langkah-langkah iterasi yang baru selesai
+    print(
+        f"""Iterasi ke-{pso.iteration}
+1.) menentukan (x,y) = {list(zip(pso.old_x, pso.old_y))}
+2.) menentukan f(x,y) = {[round(obj_func(x, y),4) for x, y in zip(pso.old_x, pso.old_y)]}
+3.) menentukan gBest = {pso.g_best}
+4.) menentukan pBest = {pso.p_best}
+5.) menentukan (vx,vy) = {pso.v}
+6.) update (x,y) = {list(zip(pso.x, pso.y))}\n"""
+    )
+
+
+def print_result(pso: PSO) -> None:
+    # listener FINISHED, mencetak nilai minimum yang ditemukan
+    print(
+        f"Nilai minimum dari f(x,y) adalah {obj_func(pso.g_best[0], pso.g_best[1]):.4f}"
+    )
+
+
+def main() -> None:
+    x_0, y_0 = 1.0, 1.0
+    x_1, y_1 = -2.0, -1.0
+    x_2, y_2 = 2.0, 2.0
+    v_0 = 0.0
+    c_1 = 1.0
+    c_2 = 0.5
+    r_1 = 1.0
+    r_2 = 1.0
+    w = 1.0
+
+    particles_x, particles_y = [x_0, x_1, x_2], [y_0, y_1, y_2]
+    velocities = [v_0 for _ in range(len(particles_x))]
+    acceleration_coefficients = [c_1, c_2]
+    random_numbers = [r_1, r_2]
+    inertia_weight = w
+    pso = PSO(
+        particles_x,
+        particles_y,
+        velocities,
+        acceleration_coefficients,
+        random_numbers,
+        inertia_weight,
+    )
+    pso.events.subscribe(ITERATION_START, print_parameters)
+    pso.events.subscribe(ITERATION_END, print_iteration)
+    pso.events.subscribe(FINISHED, print_result)
+    pso.iterate(3)
+
+
+if __name__ == "__main__":
+    main()
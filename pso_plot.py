@@ -0,0 +1,137 @@
+import numpy as np
+
+from pso_history import History
+from pso_vectorized import PSO, batch_obj_func
+
+
+def bands(values: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Merangkum nilai seluruh partikel setiap rekaman menjadi pita
+    minimum, median dan maksimum.
+
+    Parameter:
+    - values: Array (n_records, n_particles, ...) seperti f(x) atau x
+
+    Kembalian:
+    - (minimum, median, maksimum), masing-masing (n_records, ...)
+    """
+    return values.min(axis=1), np.median(values, axis=1), values.max(axis=1)
+
+
+def decimate(
+    iterations: np.ndarray,
+    low: np.ndarray,
+    middle: np.ndarray,
+    high: np.ndarray,
+    max_points: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Mengurangi jumlah titik menjadi paling banyak max_points dengan
+    menggabungkan rekaman yang berurutan: minimum dan maksimum setiap
+    kelompok tetap dipertahankan, garis tengah dirata-ratakan. Biaya
+    menggambar tidak lagi bergantung pada panjang run.
+    """
+    if len(iterations) <= max_points:
+        return iterations, low, middle, high
+    starts: np.ndarray = np.linspace(0, len(iterations), max_points + 1).astype(int)[
+        :-1
+    ]
+    counts: np.ndarray = np.diff(np.append(starts, len(iterations)))
+    counts = counts.reshape(-1, *([1] * (middle.ndim - 1)))
+    return (
+        iterations[np.append(starts[1:], len(iterations)) - 1],
+        np.minimum.reduceat(low, starts),
+        np.add.reduceat(middle, starts) / counts,
+        np.maximum.reduceat(high, starts),
+    )
+
+
+def as_history(source) -> History:
+    # sumber riwayat: History, PSO, atau path file .npz (riwayat/checkpoint)
+    if isinstance(source, History):
+        return source
+    if isinstance(source, PSO):
+        return source.history
+    return History.load(source)
+
+
+def plot_trace(source, path: str, max_points: int = 1000, dims: int = 4) -> None:
+    """
+    Menggambar riwayat PSO langsung ke file gambar tanpa layar (backend Agg):
+    f(x) dan f(gBest), posisi setiap dimensi, dan besar velocity. Nilai
+    seluruh partikel digambar sebagai pita minimum-median-maksimum, bukan
+    satu garis per partikel.
+
+    Parameter:
+    - source: History, PSO, atau path file .npz dari History.save() atau
+      PSO.save()
+    - path: File tujuan, formatnya mengikuti ekstensi (.png, .svg, .pdf)
+    - max_points: Jumlah titik maksimum setiap garis
+    - dims: Jumlah dimensi pertama yang digambar
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    history: History = as_history(source)
+    iterations: np.ndarray = history.iterations
+    full: bool = history.mode != "g_best"
+    n_dims: int = min(dims, history.g_best.shape[1]) if len(history) else 0
+
+    figure: Figure = Figure(figsize=(12, 4 * (2 + n_dims if full else 1)))
+    FigureCanvasAgg(figure)
+    axes = figure.subplots(2 + n_dims if full else 1, 1, squeeze=False)[:, 0]
+
+    # f(gBest) tidak pernah naik, sehingga minimum kelompok = nilai terakhirnya
+    x_g, f_g, _, _ = decimate(
+        iterations, history.f_g_best, history.f_g_best, history.f_g_best, max_points
+    )
+    axes[0].plot(x_g, f_g, color="tab:red", label="f(gBest)")
+    axes[0].set_title("f(x)")
+    if full:
+        x_f, low, middle, high = decimate(iterations, *bands(history.f_x), max_points)
+        axes[0].fill_between(x_f, low, high, alpha=0.3, label="f(x) min-max")
+        axes[0].plot(x_f, middle, label="f(x) median")
+
+        speed: np.ndarray = np.linalg.norm(history.v, axis=2)
+        x_v, low, middle, high = decimate(iterations, *bands(speed), max_points)
+        axes[1].fill_between(x_v, low, high, alpha=0.3, label="|v| min-max")
+        axes[1].plot(x_v, middle, label="|v| median")
+        axes[1].set_title("velocity")
+        axes[1].legend()
+
+        x_x, low, middle, high = decimate(
+            iterations, *bands(history.x[:, :, :n_dims]), max_points
+        )
+        # gBest diambil dari rekaman terakhir setiap kelompok
+        g_best: np.ndarray = history.g_best[np.searchsorted(iterations, x_x), :n_dims]
+        for k, ax in enumerate(axes[2:]):
+            ax.fill_between(x_x, low[:, k], high[:, k], alpha=0.3, label="x min-max")
+            ax.plot(x_x, middle[:, k], label="x median")
+            ax.plot(x_x, g_best[:, k], color="tab:red", label="gBest")
+            ax.set_title(f"x_{k}")
+            ax.legend()
+    axes[0].legend()
+    axes[-1].set_xlabel("iterasi")
+    figure.tight_layout()
+    figure.savefig(path)
+
+
+def main() -> None:
+    rng: np.random.Generator = np.random.default_rng(0)
+    pso: PSO = PSO(
+        rng.uniform(-5.0, 5.0, (300, 2)),
+        0.0,
+        [1.0, 0.5],
+        None,
+        0.7,
+        batch_obj_func,
+        seed=rng,
+    )
+    pso.iterate(2000)
+    pso.history.save("pso_trace.npz")
+    plot_trace("pso_trace.npz", "pso_trace.png")
+    print("riwayat disimpan ke pso_trace.npz, gambar ke pso_trace.png")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+import json
+import time
+from typing import Callable
+
+import numpy as np
+
+from events import ITERATION_END
+from pso_vectorized import PSO, batch_obj_func
+
+# fase iterasi yang diukur, nama lama pada kelas berbasis loop disamakan
+PHASES: dict[str, str] = {
+    "find_g_best": "find_g_best",
+    "find_p_best": "find_p_best",
+    "find_l_best": "find_l_best",
+    "update_v": "update_v",
+    "update_velocities": "update_v",
+    "update_x": "update_x",
+    "update_particles": "update_x",
+}
+HISTORY: str = "history"
+EVALUATION: str = "evaluation"
+
+
+# Pengukur waktu setiap fase iterasi PSO
+class Profiler:
+    def __init__(self, pso, module=None) -> None:
+        """
+        Memasang pengukur waktu pada objek pso dengan membungkus method fase
+        iterasinya (hanya pada objek ini, kelasnya tidak diubah). Waktu
+        evaluasi f(x) dihitung terpisah dan dikurangkan dari fase yang
+        memanggilnya, sehingga waktu setiap fase tidak saling tumpang tindih.
+
+        Parameter:
+        - pso: PSO dari pso_vectorized, atau kelas PSO berbasis loop
+          (pso_single_variable, pso_multi_variable)
+        - module: Modul tempat obj_func kelas berbasis loop, agar pemanggilan
+          obj_func ikut diukur dan dihitung. Selama pengukuran, obj_func
+          modul tersebut diganti dengan versi yang terukur; panggil detach()
+          untuk mengembalikannya
+        """
+        self.pso = pso
+        self.module = module
+        self.phases: list[str] = list(dict.fromkeys(PHASES.values())) + [
+            HISTORY,
+            EVALUATION,
+        ]
+        self.total: dict[str, float] = dict.fromkeys(self.phases, 0.0)
+        self.calls: dict[str, int] = dict.fromkeys(self.phases, 0)
+        self.n_evals: int = 0
+        # waktu setiap fase pada iterasi yang sedang berjalan dan sebelumnya
+        self.current: dict[str, float] = dict.fromkeys(self.phases, 0.0)
+        self.iterations: list[dict[str, float]] = []
+        # waktu fase anak yang berjalan di dalam fase yang sedang diukur
+        self.nested: list[float] = []
+        # (objek, nama atribut, nilai asli atau None jika berasal dari kelas)
+        self.wrapped: list[tuple[object, str, Callable | None]] = []
+
+        for method, phase in PHASES.items():
+            if hasattr(pso, method):
+                self.wrap(pso, method, phase)
+        if hasattr(pso, "history"):
+            self.wrap(pso.history, "record", HISTORY)
+        if hasattr(pso, "evaluate"):
+            self.wrap(pso, "evaluate", EVALUATION, count=len)
+        if module is not None:
+            self.wrap(module, "obj_func", EVALUATION, count=1)
+        pso.events.subscribe(ITERATION_END, self.end_iteration)
+
+    def wrap(
+        self, owner, name: str, phase: str, count: Callable | int | None = None
+    ) -> None:
+        """
+        Mengganti atribut name milik owner dengan versi yang waktunya
+        ditambahkan ke fase phase. count adalah jumlah evaluasi f(x) per
+        pemanggilan, atau fungsi argumen -> jumlah evaluasi.
+        """
+        func: Callable = getattr(owner, name)
+
+        def wrapper(*args, **kwargs):
+            self.nested.append(0.0)
+            start: float = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed: float = time.perf_counter() - start
+                own: float = elapsed - self.nested.pop()
+                if self.nested:
+                    self.nested[-1] += elapsed
+                self.total[phase] += own
+                self.current[phase] += own
+                self.calls[phase] += 1
+                if count is not None:
+                    self.n_evals += count if isinstance(count, int) else count(*args)
+
+        self.wrapped.append((owner, name, vars(owner).get(name)))
+        setattr(owner, name, wrapper)
+
+    def end_iteration(self, *args) -> None:
+        # listener ITERATION_END, menutup catatan waktu satu iterasi
+        self.iterations.append(self.current)
+        self.current = dict.fromkeys(self.phases, 0.0)
+
+    def detach(self) -> None:
+        # mengembalikan method dan obj_func asli
+        for owner, name, func in reversed(self.wrapped):
+            if func is None:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, func)
+        self.wrapped = []
+        self.pso.events.unsubscribe(ITERATION_END, self.end_iteration)
+
+    def summary(self) -> dict:
+        """
+        Ringkasan pengukuran: untuk setiap fase total waktu (detik), jumlah
+        pemanggilan, rata-rata waktu per iterasi dan bagiannya dari total,
+        serta jumlah evaluasi f(x) dan waktu setiap fase per iterasi.
+        """
+        n_iterations: int = len(self.iterations)
+        total: float = sum(self.total.values())
+        return {
+            "n_iterations": n_iterations,
+            "n_evals": self.n_evals,
+            "total": total,
+            "phases": {
+                phase: {
+                    "total": self.total[phase],
+                    "calls": self.calls[phase],
+                    "per_iteration": self.total[phase] / max(n_iterations, 1),
+                    "fraction": self.total[phase] / total if total else 0.0,
+                }
+                for phase in self.phases
+            },
+            "iterations": {
+                phase: [iteration[phase] for iteration in self.iterations]
+                for phase in self.phases
+            },
+        }
+
+    def dump_stats(self, path: str) -> None:
+        # menyimpan summary() ke file JSON
+        with open(path, "w") as file:
+            json.dump(self.summary(), file, indent=2)
+
+
+def print_summary(profiler: Profiler) -> None:
+    summary: dict = profiler.summary()
+    print(
+        f"{summary['n_iterations']} iterasi, {summary['n_evals']} evaluasi f(x), "
+        f"total {summary['total']:.4f} detik"
+    )
+    for phase, stats in summary["phases"].items():
+        print(
+            f"{phase:>12}: {stats['total']:.4f} detik "
+            f"({100 * stats['fraction']:.1f}%), {stats['calls']} panggilan"
+        )
+
+
+def main() -> None:
+    positions: np.ndarray = np.random.default_rng(0).uniform(-5.0, 5.0, (1000, 2))
+    pso: PSO = PSO(positions, 0.0, [1.0, 0.5], None, 0.7, batch_obj_func, seed=0)
+    profiler: Profiler = Profiler(pso)
+    pso.iterate(200)
+    print_summary(profiler)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+import numpy as np
+
+from events import ITERATION_START
+from pso_benchmark import rastrigin, sphere
+from pso_stopping import StoppingCriteria
+from pso_vectorized import PSO
+
+# Jadwal w dan c selama iterasi. Setiap jadwal adalah listener
+# ITERATION_START yang mengubah pso.w atau pso.c sebelum velocity dihitung,
+# sehingga kelas PSO tidak perlu diubah. Pasang dengan use_schedule().
+
+
+def constriction(c_1: float = 2.05, c_2: float = 2.05) -> tuple[float, list[float]]:
+    """
+    Constriction factor Clerc: v = chi * (v + c_1*r_1*(pBest - x) +
+    c_2*r_2*(gBest - x)), dengan phi = c_1 + c_2 > 4 dan
+    chi = 2 / |2 - phi - sqrt(phi^2 - 4*phi)|.
+
+    Bentuk ini sama dengan PSO biasa dengan w = chi dan c = chi * [c_1, c_2],
+    sehingga dikembalikan sebagai (w, c) untuk konstruktor PSO.
+    """
+    phi: float = c_1 + c_2
+    if phi <= 4.0:
+        raise ValueError("constriction factor membutuhkan c_1 + c_2 > 4")
+    chi: float = 2.0 / abs(2.0 - phi - np.sqrt(phi**2 - 4.0 * phi))
+    return chi, [chi * c_1, chi * c_2]
+
+
+def progress(pso: PSO, n_iterations: int) -> float:
+    # posisi iterasi saat ini dalam rentang 0 sampai 1
+    return min(pso.iteration / max(n_iterations - 1, 1), 1.0)
+
+
+# w turun linear dari w_start ke w_end selama n_iterations iterasi
+class LinearInertia:
+    def __init__(
+        self, n_iterations: int, w_start: float = 0.9, w_end: float = 0.4
+    ) -> None:
+        self.n_iterations: int = n_iterations
+        self.w_start: float = w_start
+        self.w_end: float = w_end
+
+    def __call__(self, pso: PSO) -> None:
+        t: float = progress(pso, self.n_iterations)
+        pso.w = self.w_start + (self.w_end - self.w_start) * t
+
+
+# Time-varying acceleration coefficients (TVAC): c1 turun dan c2 naik linear
+class TimeVaryingCoefficients:
+    def __init__(
+        self,
+        n_iterations: int,
+        c_1: tuple[float, float] = (2.5, 0.5),
+        c_2: tuple[float, float] = (0.5, 2.5),
+    ) -> None:
+        """
+        Parameter:
+        - n_iterations: Jumlah iterasi jadwal
+        - c_1: (awal, akhir) c1, eksplorasi oleh pBest di awal
+        - c_2: (awal, akhir) c2, konvergensi ke gBest di akhir
+        """
+        self.n_iterations: int = n_iterations
+        self.c_1: tuple[float, float] = c_1
+        self.c_2: tuple[float, float] = c_2
+
+    def __call__(self, pso: PSO) -> None:
+        t: float = progress(pso, self.n_iterations)
+        pso.c = [
+            self.c_1[0] + (self.c_1[1] - self.c_1[0]) * t,
+            self.c_2[0] + (self.c_2[1] - self.c_2[0]) * t,
+        ]
+
+
+# w adaptif berdasarkan success rate swarm pada iterasi sebelumnya
+class AdaptiveInertia:
+    def __init__(self, w_min: float = 0.4, w_max: float = 0.9) -> None:
+        """
+        w = w_min + (w_max - w_min) * S, dengan S adalah bagian partikel
+        yang f(x)-nya membaik dibanding posisi sebelumnya. Banyak partikel
+        yang membaik menandakan swarm masih jauh dari optimum sehingga w
+        dinaikkan, sebaliknya w diturunkan agar swarm memperhalus pencarian.
+        """
+        self.w_min: float = w_min
+        self.w_max: float = w_max
+
+    def __call__(self, pso: PSO) -> None:
+        if pso.iteration == 0:
+            return
+        # posisi ini memang dievaluasi pada iterasi ini, tidak ada evaluasi
+        # tambahan
+        pso.update_fitness()
+        success: float = float(np.mean(pso.f_x < pso.f_old_x))
+        pso.w = self.w_min + (self.w_max - self.w_min) * success
+
+
+def use_schedule(pso: PSO, *schedules) -> PSO:
+    # memasang jadwal pada pso, dijalankan sebelum setiap iterasi
+    for schedule in schedules:
+        pso.events.subscribe(ITERATION_START, schedule)
+    return pso
+
+
+def main() -> None:
+    # jumlah evaluasi rata-rata sampai f(gBest) <= target
+    n_iterations: int = 1000
+    w_chi, c_chi = constriction()
+    runs: dict[str, tuple[float, list[float], list]] = {
+        "konstan": (0.7, [1.5, 1.5], []),
+        "linear": (0.9, [1.5, 1.5], [LinearInertia(n_iterations)]),
+        "constriction": (w_chi, c_chi, []),
+        "tvac": (
+            0.9,
+            [2.5, 0.5],
+            [LinearInertia(n_iterations), TimeVaryingCoefficients(n_iterations)],
+        ),
+        "adaptif": (0.9, [1.5, 1.5], [AdaptiveInertia()]),
+    }
+    for func, target in ((sphere, 1e-6), (rastrigin, 20.0)):
+        print(f"{func.__name__}, target f(gBest) <= {target}")
+        for name, (w, c, schedules) in runs.items():
+            # jumlah evaluasi setiap run yang mencapai target
+            evals: list[int] = []
+            for seed in range(10):
+                rng: np.random.Generator = np.random.default_rng(seed)
+                pso: PSO = PSO(
+                    rng.uniform(-5.12, 5.12, (30, 10)), 0.0, c, None, w, func, seed=rng
+                )
+                use_schedule(pso, *schedules)
+                result = pso.iterate(n_iterations, stop=StoppingCriteria(target=target))
+                if result.f_g_best <= target:
+                    evals.append(result.n_evals)
+            mean: str = f"{np.mean(evals):8.0f}" if evals else "       -"
+            print(f"{name:>12}: {mean} evaluasi, {len(evals)}/10 mencapai target")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-import matplotlib.pyplot as plt
+from events import BEST_IMPROVED, FINISHED, ITERATION_END, ITERATION_START, Events
 
 
 def obj_func(x: float) -> float:
@@ -19,6 +19,9 @@ class PSO:
         self.c: list[float] = c
         self.r: list[float] = r
         self.w: float = w
+        # jumlah iterasi yang sudah selesai, dibaca oleh listener
+        self.iteration: int = 0
+        self.events: Events = Events()
 
         self.old_x: list[float] = x.copy()
         self.p_best: list[float] = x.copy()
@@ -38,11 +41,9 @@ class PSO:
     def find_g_best(self) -> None:
         f_values: list[float] = [obj_func(i) for i in self.x]
         minimum_index: int = f_values.index(min(f_values))
-        self.g_best = (
-            self.x[minimum_index]
-            if obj_func(self.x[minimum_index]) < obj_func(self.g_best)
-            else self.g_best
-        )
+        if obj_func(self.x[minimum_index]) < obj_func(self.g_best):
+            self.g_best = self.x[minimum_index]
+            self.events.emit(BEST_IMPROVED, self)
 
     def update_v(self) -> None:
         for i, (v, x, p_best) in enumerate(zip(self.v, self.x, self.p_best)):
@@ -57,16 +58,8 @@ class PSO:
             self.old_x[i], self.x[i] = x, x + v
 
     def iterate(self, n) -> None:
-        print(
-            f"""Iterasi ke-0
-nilai x = {self.x}
-nilai v = {self.v}
-nilai c = {self.c}
-nilai r = {self.r}
-nilai w = {self.w}
-"""
-        )
-        for i in range(n):
+        for _ in range(n):
+            self.events.emit(ITERATION_START, self)
             self.find_g_best()
             self.find_p_best()
             self.update_v()
@@ -76,20 +69,15 @@ nilai w = {self.w}
             self.g_best_history.append(self.g_best)
             self.v_history.append(self.v.copy())
             self.f_x_history.append([obj_func(i) for i in self.x])
+            self.iteration += 1
+            self.events.emit(ITERATION_END, self)
 
-            print(
-                f"""iterasi ke-{i+1}
-1.) menentukan x = {self.old_x}
-2.) menentukan f(x) = {[obj_func(i) for i in self.old_x]}
-3.) menentukan gBest = {self.g_best}
-4.) menentukan pBest = {self.p_best}
-5.) menentukan v = {self.v}
-6.) update x = {self.x}\n"""
-            )
-
-        print(f"nilai minimum dari f(x) adalah {obj_func(self.g_best)}")
+        self.events.emit(FINISHED, self)
 
     def plot(self):
+        # diimpor saat dipakai agar import modul dan proses worker tetap ringan
+        import matplotlib.pyplot as plt
+
         fig, axs = plt.subplots(2, 2, figsize=(15, 15))
 
         axs[0, 0].plot(range(1, len(self.x_history) + 1), self.x_history)
@@ -132,6 +120,38 @@ nilai w = {self.w}
         plt.show()
 
 
+def print_parameters(pso: PSO) -> None:
+    # listener ITERATION_START, mencetak nilai awal sebelum iterasi pertama
+    if pso.iteration == 0:
+        print(
+            f"""Iterasi ke-0
+nilai x = {pso.x}
+nilai v = {pso.v}
+nilai c = {pso.c}
+nilai r = {pso.r}
+nilai w = {pso.w}
+"""
+        )
+
+
+def print_iteration(pso: PSO) -> None:
+    # listener ITERATION_END, mencetak langkah-langkah iterasi yang baru selesai
+    print(
+        f"""iterasi ke-{pso.iteration}
+1.) menentukan x = {pso.old_x}
+2.) menentukan f(x) = {[obj_func(i) for i in pso.old_x]}
+3.) menentukan gBest = {pso.g_best}
+4.) menentukan pBest = {pso.p_best}
+5.) menentukan v = {pso.v}
+6.) update x = {pso.x}\n"""
+    )
+
+
+def print_result(pso: PSO) -> None:
+    # listener FINISHED, mencetak nilai minimum yang ditemukan
+    print(f"nilai minimum dari f(x) adalah {obj_func(pso.g_best)}")
+
+
 def main() -> None:
     x_0: float = 0.0
     x_1: float = -3.0
@@ -154,6 +174,9 @@ def main() -> None:
         random_numbers,
         inertia_weight,
     )
+    pso.events.subscribe(ITERATION_START, print_parameters)
+    pso.events.subscribe(ITERATION_END, print_iteration)
+    pso.events.subscribe(FINISHED, print_result)
     pso.iterate(3)
     pso.plot()
 
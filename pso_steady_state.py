@@ -0,0 +1,203 @@
+import random
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+
+import numpy as np
+
+from events import BEST_IMPROVED, FINISHED, ITERATION_END, ITERATION_START
+from pso_stopping import MAX_EVALS, Result, StoppingCriteria
+from pso_topology import local_best
+from pso_vectorized import PSO, print_result
+
+
+# PSO steady-state: setiap partikel bergerak begitu evaluasinya selesai
+class SteadyStatePSO(PSO):
+    """
+    Pada PSO biasa setiap iterasi menunggu seluruh partikel selesai
+    dievaluasi sebelum gBest diperbarui dan partikel bergerak. Di sini setiap
+    partikel dievaluasi sebagai tugas terpisah, dan begitu hasilnya kembali
+    partikel itu memperbarui pBest dan gBest, lalu langsung bergerak dengan
+    gBest terbaru dan dievaluasi lagi. Worker tidak perlu menunggu partikel
+    yang paling lambat.
+
+    Satu "iterasi" di sini adalah n_particles evaluasi yang selesai, sehingga
+    iterate(n) menjalankan n * n_particles evaluasi setelah posisi awal.
+    Urutan selesainya evaluasi bergantung pada waktu, sehingga hasilnya tidak
+    bisa diulang persis walaupun seed sama.
+
+    Setiap partikel dikirim ke executor sebagai obj_func(posisi), tanpa
+    melewati evaluator dan evaluate(). Karena itu evaluator pembungkus
+    (pso_memo, pso_surrogate) dan pso_profiler.Profiler tidak didukung dan
+    iterate melempar ValueError jika salah satunya terpasang.
+    """
+
+    def move(self, i: int) -> None:
+        # memperbarui velocity dan posisi partikel i dengan gBest (atau lBest)
+        # saat ini
+        r_1, r_2 = (
+            self.r
+            if self.r is not None
+            else self.rng.random((2, self.x.shape[1]), dtype=self.dtype)
+        )
+        social: np.ndarray = (
+            self.g_best
+            if self.neighbors is None
+            else self.p_best[local_best(self.neighbors[i : i + 1], self.f_p_best)[0]]
+        )
+        self.v[i] = (
+            (self.w * self.v[i])
+            + (self.c[0] * r_1 * (self.p_best[i] - self.x[i]))
+            + (self.c[1] * r_2 * (social - self.x[i]))
+        )
+        self.old_x[i] = self.x[i]
+        self.f_old_x[i] = self.f_x[i]
+        self.x[i] += self.v[i]
+
+    def accept(self, i: int, fitness: float) -> None:
+        # menyimpan f(x) partikel i lalu memperbarui pBest dan gBest-nya
+        self.n_evals += 1
+        self.f_x[i] = fitness
+        if fitness < self.f_g_best:
+            self.g_best = self.x[i].copy()
+            self.f_g_best = fitness
+            self.events.emit(BEST_IMPROVED, self)
+        if fitness < self.f_old_x[i]:
+            self.p_best[i] = self.x[i]
+            self.f_p_best[i] = fitness
+        else:
+            self.p_best[i] = self.old_x[i]
+            self.f_p_best[i] = self.f_old_x[i]
+
+    def check_evaluator(self) -> None:
+        # evaluasi per partikel tidak melewati evaluator maupun evaluate()
+        if self.evaluator is not self.obj_func or "evaluate" in vars(self):
+            raise ValueError(
+                "SteadyStatePSO mengirim obj_func langsung ke executor, "
+                "evaluator pembungkus (cache, surrogate) dan Profiler tidak "
+                "didukung"
+            )
+
+    def submit(self, executor: Executor, i: int) -> Future:
+        return executor.submit(self.obj_func, self.x[i : i + 1].copy())
+
+    def cancel(self, pending: dict[Future, int]) -> None:
+        # evaluasi yang belum mulai dibatalkan, yang sedang berjalan ditunggu
+        for future in [future for future in pending if future.cancel()]:
+            del pending[future]
+            self.f_x_valid = False
+
+    def iterate(
+        self,
+        n: int,
+        workers: int | None = None,
+        stop: StoppingCriteria | None = None,
+        executor: Executor | None = None,
+    ) -> Result:
+        """
+        Menjalankan PSO steady-state sebanyak n * n_particles evaluasi.
+
+        Parameter:
+        - n: Jumlah iterasi maksimum
+        - workers: Jumlah proses worker jika executor tidak diberikan, default
+          os.cpu_count(). obj_func harus bisa di-pickle
+        - stop: Kriteria berhenti lebih awal, diperiksa setiap iterasi
+        - executor: Executor concurrent.futures yang dipakai, misalnya
+          ThreadPoolExecutor untuk fungsi objektif yang menunggu I/O. Tidak
+          ditutup oleh iterate
+
+        Setiap partikel dikirim sebagai satu tugas, sehingga mode ini cocok
+        untuk fungsi objektif yang mahal dan waktunya tidak merata; untuk
+        fungsi murah, overhead per tugas lebih besar dari waktu yang dihemat.
+        """
+        self.check_evaluator()
+        start: int = self.begin(n, stop)
+        own_executor: bool = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(workers)
+
+        # posisi awal dievaluasi sekaligus, lalu state dipisah per partikel
+        self.find_g_best()
+        self.find_p_best()
+        self.f_x = self.f_x.copy()
+        self.f_old_x = self.f_old_x.copy()
+        self.p_best = self.p_best.copy()
+        self.f_p_best = self.f_p_best.copy()
+
+        n_particles: int = len(self.x)
+        remaining: int = n * n_particles
+        # evaluasi yang sedang berjalan ikut dihitung, sehingga max_evals
+        # tidak terlampaui oleh evaluasi yang masih ditunggu
+        budget: float = (
+            stop.max_evals
+            if stop is not None and stop.max_evals is not None
+            else np.inf
+        )
+        completed: int = 0
+        stopped: bool = False
+        pending: dict[Future, int] = {}
+        if remaining:
+            self.events.emit(ITERATION_START, self)
+        try:
+            for i in range(n_particles):
+                if remaining == 0 or self.n_evals + len(pending) >= budget:
+                    break
+                self.move(i)
+                pending[self.submit(executor, i)] = i
+                remaining -= 1
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = pending.pop(future)
+                    self.accept(i, float(future.result()[0]))
+                    completed += 1
+                    if remaining > 0 and self.n_evals + len(pending) < budget:
+                        self.move(i)
+                        pending[self.submit(executor, i)] = i
+                        remaining -= 1
+
+                    # evaluasi yang selesai setelah berhenti tidak membentuk
+                    # iterasi baru
+                    if completed % n_particles == 0 and not stopped:
+                        self.iteration += 1
+                        self.history.record(self.iteration, self)
+                        self.events.emit(ITERATION_END, self)
+                        if self.should_stop(stop):
+                            stopped = True
+                            remaining = 0
+                            self.cancel(pending)
+                        elif pending:
+                            self.events.emit(ITERATION_START, self)
+            if remaining > 0 and not stopped:
+                # iterasi terakhir terpotong karena batas evaluasi
+                self.stop_reason = MAX_EVALS
+        finally:
+            if own_executor:
+                executor.shutdown(cancel_futures=True)
+        return self.finish(start)
+
+
+def uneven_obj_func(x: float, y: float) -> float:
+    # fungsi objektif pso_vectorized dengan waktu evaluasi yang tidak merata
+    time.sleep(random.expovariate(100.0))
+    return 0.26 * (x**2 + y**2) - 0.48 * x * y
+
+
+def main() -> None:
+    positions: np.ndarray = np.random.default_rng(0).uniform(-5.0, 5.0, (16, 2))
+    for pso_class in (PSO, SteadyStatePSO):
+        pso: PSO = pso_class(positions, 0.0, [1.0, 0.5], None, 0.7, uneven_obj_func)
+        pso.events.subscribe(FINISHED, print_result)
+        start: float = time.perf_counter()
+        pso.iterate(10, workers=8)
+        print(f"{pso_class.__name__}: {time.perf_counter() - start:.2f} detik\n")
+
+
+if __name__ == "__main__":
+    main()
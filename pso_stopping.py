@@ -0,0 +1,112 @@
+import time
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+
+# alasan berhentinya iterasi
+MAX_ITERATIONS: str = "max_iterations"
+ABSOLUTE_TOLERANCE: str = "ftol"
+RELATIVE_TOLERANCE: str = "rtol"
+STAGNATION: str = "stagnation"
+DIAMETER: str = "diameter"
+MAX_TIME: str = "max_time"
+MAX_EVALS: str = "max_evals"
+TARGET: str = "target"
+
+
+@dataclass
+class Result:
+    g_best: np.ndarray
+    f_g_best: float
+    iterations: int
+    n_evals: int
+    reason: str
+
+
+def diameter(x: np.ndarray) -> float:
+    # diagonal kotak pembatas swarm, O(n_particles * n_dims)
+    return float(np.linalg.norm(x.max(axis=0) - x.min(axis=0)))
+
+
+# Kriteria berhenti lebih awal untuk PSO.iterate
+class StoppingCriteria:
+    def __init__(
+        self,
+        ftol: float | None = None,
+        rtol: float | None = None,
+        window: int = 10,
+        patience: int | None = None,
+        min_diameter: float | None = None,
+        max_time: float | None = None,
+        max_evals: int | None = None,
+        target: float | None = None,
+    ) -> None:
+        """
+        Inisialisasi kriteria berhenti. Kriteria yang bernilai None tidak
+        diperiksa.
+
+        Parameter:
+        - ftol: Berhenti jika penurunan f(gBest) selama window iterasi
+          terakhir <= ftol
+        - rtol: Berhenti jika penurunan f(gBest) selama window iterasi
+          terakhir <= rtol * |f(gBest)|
+        - window: Jumlah iterasi untuk ftol dan rtol
+        - patience: Berhenti jika gBest tidak membaik selama patience iterasi
+        - min_diameter: Berhenti jika diameter swarm < min_diameter
+        - max_time: Batas waktu dalam detik
+        - max_evals: Batas jumlah evaluasi f(x), iterasi berikutnya tidak
+          dijalankan jika akan melebihi batas ini
+        - target: Berhenti jika f(gBest) <= target
+        """
+        self.ftol: float | None = ftol
+        self.rtol: float | None = rtol
+        self.window: int = window
+        self.patience: int | None = patience
+        self.min_diameter: float | None = min_diameter
+        self.max_time: float | None = max_time
+        self.max_evals: int | None = max_evals
+        self.target: float | None = target
+
+        self.start_time: float = 0.0
+        self.recent: deque[float] = deque(maxlen=window + 1)
+        self.stagnant: int = 0
+
+    def start(self, pso) -> None:
+        # dipanggil sekali di awal iterate
+        self.start_time = time.perf_counter()
+        self.recent.clear()
+        self.recent.append(pso.f_g_best)
+        self.stagnant = 0
+
+    def check(self, pso) -> str | None:
+        """
+        Dipanggil setelah setiap iterasi. Mengembalikan alasan berhenti, atau
+        None jika iterasi boleh dilanjutkan.
+        """
+        previous: float = self.recent[-1]
+        self.recent.append(pso.f_g_best)
+        self.stagnant = self.stagnant + 1 if pso.f_g_best >= previous else 0
+
+        if self.target is not None and pso.f_g_best <= self.target:
+            return TARGET
+        if len(self.recent) == self.recent.maxlen:
+            improvement: float = self.recent[0] - self.recent[-1]
+            if self.ftol is not None and improvement <= self.ftol:
+                return ABSOLUTE_TOLERANCE
+            if self.rtol is not None and improvement <= self.rtol * abs(
+                self.recent[-1]
+            ):
+                return RELATIVE_TOLERANCE
+        if self.patience is not None and self.stagnant >= self.patience:
+            return STAGNATION
+        if self.min_diameter is not None and diameter(pso.x) < self.min_diameter:
+            return DIAMETER
+        if (
+            self.max_time is not None
+            and time.perf_counter() - self.start_time >= self.max_time
+        ):
+            return MAX_TIME
+        if self.max_evals is not None and pso.n_evals + len(pso.x) > self.max_evals:
+            return MAX_EVALS
+        return None
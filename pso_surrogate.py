@@ -0,0 +1,204 @@
+import time
+from typing import Callable
+
+import numpy as np
+
+from pso_benchmark import rosenbrock
+from pso_evaluation import batch_objective
+from pso_vectorized import PSO
+
+
+# Model pengganti k-nearest neighbours dengan bobot invers jarak
+class KNNModel:
+    def __init__(self, k: int = 5) -> None:
+        self.k: int = k
+        self.positions: np.ndarray = np.empty((0, 0))
+        self.fitness: np.ndarray = np.empty(0)
+
+    def fit(self, positions: np.ndarray, fitness: np.ndarray) -> None:
+        # kNN tidak perlu dilatih, cukup menyimpan data
+        self.positions, self.fitness = positions, fitness
+
+    def predict(self, positions: np.ndarray) -> np.ndarray:
+        k: int = min(self.k, len(self.fitness))
+        distances: np.ndarray = np.linalg.norm(
+            positions[:, np.newaxis] - self.positions[np.newaxis], axis=2
+        )
+        nearest: np.ndarray = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        weights: np.ndarray = 1.0 / (
+            np.take_along_axis(distances, nearest, axis=1) + 1e-12
+        )
+        return np.sum(weights * self.fitness[nearest], axis=1) / weights.sum(axis=1)
+
+
+# Model pengganti radial basis function kubik dengan suku linear
+class RBFModel:
+    def __init__(self) -> None:
+        self.positions: np.ndarray = np.empty((0, 0))
+        self.weights: np.ndarray = np.empty(0)
+        self.n_samples: int = 0
+
+    @staticmethod
+    def basis(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        # phi(r) = r^3 untuk setiap pasangan baris a dan b
+        return np.linalg.norm(a[:, np.newaxis] - b[np.newaxis], axis=2) ** 3
+
+    @staticmethod
+    def polynomial(positions: np.ndarray) -> np.ndarray:
+        return np.hstack([np.ones((len(positions), 1)), positions])
+
+    def fit(self, positions: np.ndarray, fitness: np.ndarray) -> None:
+        """
+        Menyelesaikan sistem interpolasi [[Phi, P], [P^T, 0]] [w; b] =
+        [f; 0]. lstsq dipakai agar titik yang berulang tidak membuat sistem
+        singular.
+        """
+        p: np.ndarray = self.polynomial(positions)
+        system: np.ndarray = np.block(
+            [
+                [self.basis(positions, positions), p],
+                [p.T, np.zeros((p.shape[1], p.shape[1]))],
+            ]
+        )
+        target: np.ndarray = np.concatenate([fitness, np.zeros(p.shape[1])])
+        self.weights = np.linalg.lstsq(system, target, rcond=None)[0]
+        self.positions = positions
+        self.n_samples = len(positions)
+
+    def predict(self, positions: np.ndarray) -> np.ndarray:
+        return (
+            self.basis(positions, self.positions) @ self.weights[: self.n_samples]
+            + self.polynomial(positions) @ self.weights[self.n_samples :]
+        )
+
+
+MODELS: dict[str, Callable[[], object]] = {"knn": KNNModel, "rbf": RBFModel}
+
+
+# Evaluator yang hanya mengirim posisi menjanjikan ke fungsi objektif asli
+class SurrogateEvaluator:
+    """
+    Setiap kali dipanggil, seluruh posisi diprediksi oleh model pengganti
+    yang dilatih dari evaluasi asli sebelumnya. Hanya sebagian (fraction)
+    posisi dengan prediksi terbaik yang dievaluasi dengan fungsi asli,
+    sisanya memakai nilai prediksi. Model dilatih ulang setelah setiap
+    panggilan dengan hasil evaluasi asli yang baru.
+
+    Nilai prediksi tidak pernah lebih kecil dari f(x) asli terbaik yang
+    pernah ditemukan, sehingga gBest selalu berasal dari evaluasi asli.
+
+    Parameter:
+    - func: Fungsi objektif batch yang mahal
+    - fraction: Bagian posisi yang dievaluasi dengan fungsi asli
+    - model: "rbf" atau "knn"
+    - min_samples: Semua posisi dievaluasi asli sampai arsip berisi
+      sebanyak ini
+    - max_samples: Model hanya dilatih dengan evaluasi asli terbaru sebanyak
+      ini agar biaya pelatihan tetap kecil
+    """
+
+    batched: bool = True
+
+    def __init__(
+        self,
+        func: Callable[[np.ndarray], np.ndarray],
+        fraction: float = 0.2,
+        model: str = "rbf",
+        min_samples: int = 20,
+        max_samples: int = 200,
+    ) -> None:
+        self.func: Callable[[np.ndarray], np.ndarray] = func
+        self.fraction: float = fraction
+        self.model = MODELS[model]()
+        self.min_samples: int = min_samples
+        self.max_samples: int = max_samples
+        self.positions: list[np.ndarray] = []
+        self.fitness: list[np.ndarray] = []
+        self.best: float = np.inf
+        self.n_real: int = 0
+        self.n_predicted: int = 0
+
+    def add(self, positions: np.ndarray, fitness: np.ndarray) -> None:
+        # menambah evaluasi asli ke arsip lalu melatih ulang model
+        self.positions.append(positions.copy())
+        self.fitness.append(np.asarray(fitness, dtype=np.float64))
+        self.best = min(self.best, float(np.min(fitness)))
+        archive_x: np.ndarray = np.concatenate(self.positions)[-self.max_samples :]
+        archive_f: np.ndarray = np.concatenate(self.fitness)[-self.max_samples :]
+        self.positions, self.fitness = [archive_x], [archive_f]
+        if len(archive_f) >= self.min_samples:
+            self.model.fit(archive_x, archive_f)
+
+    def __call__(self, positions: np.ndarray) -> np.ndarray:
+        if sum(len(f) for f in self.fitness) < self.min_samples:
+            fitness: np.ndarray = np.asarray(self.func(positions), dtype=np.float64)
+            self.n_real += len(positions)
+            self.add(positions, fitness)
+            return fitness
+
+        fitness = np.maximum(self.model.predict(positions), self.best)
+        n_real: int = max(1, int(np.ceil(self.fraction * len(positions))))
+        promising: np.ndarray = np.argsort(fitness, kind="stable")[:n_real]
+        real: np.ndarray = np.asarray(self.func(positions[promising]), dtype=np.float64)
+        fitness[promising] = real
+        self.n_real += n_real
+        self.n_predicted += len(positions) - n_real
+        self.add(positions[promising], real)
+        return fitness
+
+    @property
+    def real_ratio(self) -> float:
+        # bagian posisi yang dievaluasi dengan fungsi asli
+        return self.n_real / max(self.n_real + self.n_predicted, 1)
+
+
+def use_surrogate(pso: PSO, **kwargs) -> SurrogateEvaluator:
+    """
+    Memasang SurrogateEvaluator sebagai evaluator pso. Posisi awal yang
+    sudah dievaluasi menjadi data latih pertama. pso.n_evals tetap menghitung
+    seluruh posisi yang diberi nilai; jumlah evaluasi asli ada di n_real.
+    """
+    surrogate: SurrogateEvaluator = SurrogateEvaluator(pso.obj_func, **kwargs)
+    surrogate.n_real = pso.n_evals
+    # setelah iterasi, f(x) belum dihitung untuk posisi x yang baru, pasangan
+    # yang sudah dievaluasi ada di old_x dan f(old_x)
+    if pso.f_x_valid:
+        surrogate.add(pso.x, pso.f_x)
+    else:
+        surrogate.add(pso.old_x, pso.f_old_x)
+    pso.evaluator = surrogate
+    return surrogate
+
+
+@batch_objective
+def slow_obj_func(positions: np.ndarray) -> np.ndarray:
+    # Rosenbrock yang dianggap mahal, 1 ms per evaluasi
+    time.sleep(0.001 * len(positions))
+    return rosenbrock(positions)
+
+
+def main() -> None:
+    for fraction in (1.0, 0.2, 0.1):
+        rng: np.random.Generator = np.random.default_rng(0)
+        pso: PSO = PSO(
+            rng.uniform(-2.0, 2.0, (30, 4)),
+            0.0,
+            [1.5, 1.5],
+            None,
+            0.7,
+            slow_obj_func,
+            seed=rng,
+        )
+        surrogate: SurrogateEvaluator = use_surrogate(pso, fraction=fraction)
+        start: float = time.perf_counter()
+        result = pso.iterate(100)
+        print(
+            f"fraction = {fraction}: f(gBest) = {result.f_g_best:.6f}, "
+            f"{surrogate.n_real} evaluasi asli, {surrogate.n_predicted} prediksi "
+            f"(rasio asli {surrogate.real_ratio:.2f}), "
+            f"{time.perf_counter() - start:.2f} detik"
+        )
+
+
+if __name__ == "__main__":
+    main()
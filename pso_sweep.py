@@ -0,0 +1,199 @@
+import hashlib
+import itertools
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from pso_benchmark import BENCHMARKS, Benchmark
+from pso_vectorized import PSO
+
+# nilai default setiap konfigurasi, sapuan hanya mengubah sebagian
+DEFAULTS: dict = {
+    "benchmark": "sphere",
+    "n_dims": 2,
+    "n_iterations": 100,
+    "n_particles": 20,
+    "c1": 1.5,
+    "c2": 1.5,
+    "w": 0.7,
+    "r": None,
+    "seed": 0,
+}
+
+
+def grid(**axes) -> list[dict]:
+    """
+    Membuat seluruh kombinasi nilai (grid search).
+
+    Contoh: grid(c1=[0.5, 1.5], w=[0.4, 0.7], seed=range(3)) menghasilkan
+    2 * 2 * 3 konfigurasi, parameter lain memakai DEFAULTS.
+    """
+    names: list[str] = list(axes)
+    return [
+        DEFAULTS | dict(zip(names, values))
+        for values in itertools.product(*(list(axes[name]) for name in names))
+    ]
+
+
+def random_search(
+    n: int,
+    ranges: dict[str, tuple[float, float]],
+    seeds=range(1),
+    seed: int | None = None,
+    **fixed,
+) -> list[dict]:
+    """
+    Mengambil n konfigurasi acak (random search), masing-masing dijalankan
+    untuk setiap seed di seeds.
+
+    Parameter:
+    - n: Jumlah konfigurasi
+    - ranges: Rentang uniform setiap parameter, misalnya {"w": (0.4, 0.9)}
+    - seeds: Seed PSO untuk setiap konfigurasi
+    - seed: Seed pengambilan konfigurasi acak
+    - fixed: Parameter lain yang tetap
+    """
+    rng: np.random.Generator = np.random.default_rng(seed)
+    samples: dict[str, np.ndarray] = {
+        name: rng.uniform(low, high, n) for name, (low, high) in ranges.items()
+    }
+    return [
+        DEFAULTS
+        | fixed
+        | {name: float(values[i]) for name, values in samples.items()}
+        | {"seed": s}
+        for i in range(n)
+        for s in seeds
+    ]
+
+
+def cache_key(config: dict) -> str:
+    # konfigurasi (termasuk seed) dalam bentuk JSON yang urutannya tetap
+    text: str = json.dumps(config, sort_keys=True)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def run_config(config: dict) -> dict:
+    # menjalankan satu konfigurasi, dipanggil di proses worker
+    benchmark: Benchmark = BENCHMARKS[config["benchmark"]]
+    n_dims: int = benchmark.n_dims or config["n_dims"]
+    rng: np.random.Generator = np.random.default_rng(config["seed"])
+    positions: np.ndarray = rng.uniform(
+        benchmark.low, benchmark.high, (config["n_particles"], n_dims)
+    )
+    start: float = time.perf_counter()
+    pso: PSO = PSO(
+        positions,
+        0.0,
+        [config["c1"], config["c2"]],
+        config["r"],
+        config["w"],
+        benchmark.func,
+        seed=rng,
+    )
+    result = pso.iterate(config["n_iterations"])
+    return {
+        "f_g_best": result.f_g_best,
+        "g_best": result.g_best.tolist(),
+        "n_evals": result.n_evals,
+        "iterations": result.iterations,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+# Cache hasil sapuan di disk, satu file JSON per konfigurasi
+class SweepCache:
+    def __init__(self, directory: str = ".pso_sweep_cache") -> None:
+        self.directory: str = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, config: dict) -> str:
+        return os.path.join(self.directory, f"{cache_key(config)}.json")
+
+    def get(self, config: dict) -> dict | None:
+        try:
+            with open(self.path(config)) as file:
+                return json.load(file)["outcome"]
+        except FileNotFoundError:
+            return None
+
+    def put(self, config: dict, outcome: dict) -> None:
+        # ditulis ke file sementara lalu diganti secara atomik
+        path: str = self.path(config)
+        with open(f"{path}.tmp", "w") as file:
+            json.dump({"config": config, "outcome": outcome}, file)
+        os.replace(f"{path}.tmp", path)
+
+
+def sweep(
+    configs: list[dict],
+    cache: SweepCache | None = None,
+    workers: int | None = None,
+) -> list[dict]:
+    """
+    Menjalankan setiap konfigurasi secara paralel dan mengembalikan
+    konfigurasi beserta hasilnya, sesuai urutan configs. Konfigurasi yang
+    sudah ada di cache tidak dijalankan ulang, dan setiap hasil langsung
+    disimpan begitu selesai sehingga sapuan yang terhenti bisa dilanjutkan.
+
+    Parameter:
+    - configs: Daftar konfigurasi dari grid() atau random_search()
+    - cache: Cache hasil, default SweepCache() di direktori kerja
+    - workers: Jumlah proses worker, default os.cpu_count()
+    """
+    cache = cache if cache is not None else SweepCache()
+    outcomes: list[dict | None] = [cache.get(config) for config in configs]
+    missing: list[int] = [i for i, outcome in enumerate(outcomes) if outcome is None]
+    if missing:
+        with ProcessPoolExecutor(workers) as executor:
+            pending: dict[Future, int] = {
+                executor.submit(run_config, configs[i]): i for i in missing
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i: int = pending.pop(future)
+                    outcomes[i] = future.result()
+                    # hanya proses utama yang menulis cache
+                    cache.put(configs[i], outcomes[i])
+    return [config | outcome for config, outcome in zip(configs, outcomes)]
+
+
+def summarize(results: list[dict], keys: list[str]) -> list[dict]:
+    # rata-rata f(gBest) dari seluruh seed untuk setiap kombinasi keys
+    groups: dict[tuple, list[float]] = {}
+    for result in results:
+        groups.setdefault(tuple(json.dumps(result[key]) for key in keys), []).append(
+            result["f_g_best"]
+        )
+    return sorted(
+        (
+            {key: json.loads(value) for key, value in zip(keys, group)}
+            | {"mean_f_g_best": float(np.mean(values)), "runs": len(values)}
+            for group, values in groups.items()
+        ),
+        key=lambda summary: summary["mean_f_g_best"],
+    )
+
+
+def main() -> None:
+    configs: list[dict] = grid(
+        benchmark=["rastrigin"],
+        n_dims=[5],
+        c1=[0.5, 1.0, 1.5, 2.0],
+        c2=[0.5, 1.0, 1.5, 2.0],
+        w=[0.4, 0.6, 0.8],
+        seed=range(5),
+    )
+    start: float = time.perf_counter()
+    results: list[dict] = sweep(configs)
+    print(f"{len(results)} konfigurasi dalam {time.perf_counter() - start:.2f} detik")
+    for summary in summarize(results, ["c1", "c2", "w"])[:5]:
+        print(summary)
+
+
+if __name__ == "__main__":
+    main()
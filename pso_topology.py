@@ -0,0 +1,99 @@
+import numpy as np
+
+# Topologi ketetanggaan untuk PSO lokal (lBest). Setiap topologi berupa array
+# indeks (n_particles, k): baris i berisi indeks partikel tetangga i, termasuk
+# i sendiri. Array ini dihitung sekali, lalu lBest setiap iterasi cukup
+# diambil dengan gather dan argmin tanpa loop Python.
+
+
+def ring(n_particles: int, k: int = 1) -> np.ndarray:
+    # k tetangga di kiri dan k tetangga di kanan, melingkar
+    offsets: np.ndarray = np.arange(-k, k + 1)
+    return (np.arange(n_particles)[:, np.newaxis] + offsets) % n_particles
+
+
+def von_neumann(n_particles: int) -> np.ndarray:
+    """
+    Partikel disusun pada grid rows x cols yang melingkar (torus), dengan
+    tetangga atas, bawah, kiri dan kanan. rows adalah faktor n_particles
+    terbesar yang tidak lebih dari akar n_particles.
+    """
+    rows: int = max(
+        i for i in range(1, int(np.sqrt(n_particles)) + 1) if n_particles % i == 0
+    )
+    cols: int = n_particles // rows
+    row, col = np.divmod(np.arange(n_particles), cols)
+    return np.stack(
+        [
+            row * cols + col,
+            (row - 1) % rows * cols + col,
+            (row + 1) % rows * cols + col,
+            row * cols + (col - 1) % cols,
+            row * cols + (col + 1) % cols,
+        ],
+        axis=1,
+    )
+
+
+def random_k(
+    n_particles: int,
+    k: int = 3,
+    seed: int | np.random.Generator | None = None,
+) -> np.ndarray:
+    """
+    k tetangga acak yang berbeda untuk setiap partikel, ditambah dirinya.
+
+    Indeks diambil dari 0..n_particles-2 lalu indeks >= i digeser satu
+    agar partikel i tidak memilih dirinya sendiri. Baris yang berisi indeks
+    kembar diambil ulang (rejection sampling), sehingga memori dan waktunya
+    O(n_particles * k), bukan O(n_particles^2). Jika k besar dibanding
+    n_particles, setiap baris diambil dengan choice tanpa pengembalian.
+    """
+    if not 0 <= k < n_particles:
+        raise ValueError("k harus lebih kecil dari jumlah partikel")
+    rng: np.random.Generator = np.random.default_rng(seed)
+    if k * k > n_particles:
+        others: np.ndarray = np.array(
+            [rng.choice(n_particles - 1, k, replace=False) for _ in range(n_particles)],
+            dtype=np.intp,
+        ).reshape(n_particles, k)
+    else:
+        others = rng.integers(0, n_particles - 1, (n_particles, k))
+        rows: np.ndarray = np.arange(n_particles)
+        while len(rows):
+            ordered: np.ndarray = np.sort(others[rows], axis=1)
+            rows = rows[(ordered[:, 1:] == ordered[:, :-1]).any(axis=1)]
+            others[rows] = rng.integers(0, n_particles - 1, (len(rows), k))
+    particles: np.ndarray = np.arange(n_particles)[:, np.newaxis]
+    others += others >= particles
+    return np.hstack([particles, others])
+
+
+def as_neighbors(topology, n_particles: int) -> np.ndarray:
+    """
+    Mengubah topologi buatan pengguna menjadi array indeks (n_particles, k).
+
+    Parameter:
+    - topology: Array (n_particles, k), atau list berisi list indeks
+      tetangga setiap partikel yang panjangnya boleh berbeda. Baris yang
+      lebih pendek diisi dengan mengulang indeks pertamanya, sehingga hasil
+      argmin tidak berubah
+    - n_particles: Jumlah partikel
+    """
+    rows: list[list[int]] = [list(neighbors) for neighbors in topology]
+    if len(rows) != n_particles or not all(rows):
+        raise ValueError("topologi harus berisi tetangga untuk setiap partikel")
+    k: int = max(len(neighbors) for neighbors in rows)
+    neighbors: np.ndarray = np.array(
+        [neighbors + neighbors[:1] * (k - len(neighbors)) for neighbors in rows],
+        dtype=np.intp,
+    )
+    if neighbors.min() < 0 or neighbors.max() >= n_particles:
+        raise ValueError("indeks tetangga di luar jumlah partikel")
+    return neighbors
+
+
+def local_best(neighbors: np.ndarray, fitness: np.ndarray) -> np.ndarray:
+    # indeks partikel dengan fitness terkecil di antara tetangga setiap partikel
+    best: np.ndarray = np.argmin(fitness[neighbors], axis=1)
+    return neighbors[np.arange(len(neighbors)), best]
@@ -0,0 +1,512 @@
+import json
+import os
+from typing import Callable
+
+import numpy as np
+
+from events import BEST_IMPROVED, FINISHED, ITERATION_END, ITERATION_START, Events
+from pso_evaluation import (
+    ProcessPoolEvaluator,
+    SharedMemoryEvaluator,
+    as_batch_objective,
+    batch_objective,
+)
+from pso_history import History
+from pso_stopping import MAX_ITERATIONS, Result, StoppingCriteria
+from pso_topology import as_neighbors, local_best
+
+
+def obj_func(x: float, y: float) -> float:
+    return 0.26 * (x**2 + y**2) - 0.48 * x * y
+
+
+@batch_objective
+def batch_obj_func(positions: np.ndarray) -> np.ndarray:
+    x, y = positions[:, 0], positions[:, 1]
+    return 0.26 * (x**2 + y**2) - 0.48 * x * y
+
+
+def spawn_rngs(seed, n: int) -> list[np.random.Generator]:
+    """
+    Membuat n generator acak yang saling independen dari satu seed, misalnya
+    satu generator untuk setiap proses worker. Hasilnya selalu sama untuk
+    seed yang sama.
+    """
+    return [
+        np.random.default_rng(sequence)
+        for sequence in np.random.SeedSequence(seed).spawn(n)
+    ]
+
+
+def as_swarm(values, dtype: type = np.float64) -> np.ndarray:
+    """
+    Mengubah daftar nilai menjadi array 2 dimensi (n_particles, n_dims).
+
+    List skalar seperti [x_0, x_1, x_2] dianggap sebagai partikel 1 dimensi.
+    """
+    array = np.atleast_1d(np.array(values, dtype=dtype))
+    return array.reshape(len(array), -1)
+
+
+# Particle Swarm Optimization (PSO) berbasis array NumPy
+class PSO:
+    def __init__(
+        self,
+        x,
+        v,
+        c: list[float],
+        r: list[float] | None,
+        w: float,
+        obj_func: Callable[..., float] = obj_func,
+        history: History | None = None,
+        seed: int | np.random.SeedSequence | np.random.Generator | None = None,
+        fitness: np.ndarray | None = None,
+        topology=None,
+        dtype: type = np.float64,
+    ) -> None:
+        """
+        Inisialisasi algoritma PSO dengan seluruh state swarm disimpan
+        sebagai array (n_particles, n_dims).
+
+        Parameter:
+        - x: Posisi partikel, list skalar atau array (n_particles, n_dims)
+        - v: Velocity partikel, per partikel (n_particles,) atau (n_particles, n_dims)
+        - c: List koefisien percepatan [c1, c2]
+        - r: List bilangan acak [r1, r2] yang tetap, atau None agar r1 dan r2
+          diambil ulang per partikel, per dimensi dan per iterasi
+        - w: Inertia weight
+        - obj_func: Fungsi objektif skalar obj_func(*posisi), fungsi
+          vektor (lihat pso_evaluation.vector_objective), atau fungsi
+          batch (lihat pso_evaluation.batch_objective) yang menerima array
+          posisi dan mengembalikan vektor fitness
+        - history: Perekam riwayat (pso_history.History), default merekam
+          seluruh partikel setiap iterasi
+        - seed: Seed atau numpy.random.Generator untuk r1 dan r2 acak
+        - fitness: f(x) awal yang sudah dihitung di luar, misalnya oleh
+          evaluator async, sehingga x tidak dievaluasi ulang
+        - topology: None agar setiap partikel mengikuti gBest, atau array
+          indeks tetangga (lihat pso_topology) agar setiap partikel mengikuti
+          pBest terbaik di antara tetangganya (lBest)
+        - dtype: Tipe data posisi, velocity, pBest dan gBest, np.float64 atau
+          np.float32. float32 memakai setengah memori untuk swarm yang sangat
+          besar; f(x) tetap disimpan dan dibandingkan sebagai float64
+        """
+        self.dtype: type = np.dtype(dtype).type
+        self.x: np.ndarray = as_swarm(x, self.dtype)
+        self.v: np.ndarray = np.broadcast_to(
+            as_swarm(v, self.dtype), self.x.shape
+        ).copy()
+        self.c: list[float] = c
+        self.r: list[float] | None = r
+        self.w: float = w
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+        self.obj_func: Callable[[np.ndarray], np.ndarray] = as_batch_objective(obj_func)
+        # evaluator yang dipakai evaluate(), diganti saat iterate paralel
+        self.evaluator: Callable[[np.ndarray], np.ndarray] = self.obj_func
+
+        # listener untuk event ITERATION_START, ITERATION_END, BEST_IMPROVED
+        # dan FINISHED, setiap listener menerima objek PSO ini
+        self.events: Events = Events()
+
+        # jumlah pemanggilan obj_func, dihitung per posisi yang dievaluasi
+        self.n_evals: int = 0
+
+        # inisialisasi nilai pBest dan gBest, serta nilai partikel sebelumnya.
+        # f(x), f(old_x), f(pBest) dan f(gBest) disimpan agar setiap posisi
+        # baru hanya dievaluasi satu kali
+        self.old_x: np.ndarray = self.x.copy()
+        self.p_best: np.ndarray = self.x.copy()
+        self.f_x: np.ndarray = (
+            self.evaluate(self.x)
+            if fitness is None
+            else np.array(fitness, dtype=np.float64).reshape(len(self.x))
+        )
+        self.f_old_x: np.ndarray = self.f_x.copy()
+        self.f_p_best: np.ndarray = self.f_x.copy()
+        minimum_index: int = int(np.argmin(self.f_x))
+        self.g_best: np.ndarray = self.x[minimum_index].copy()
+        self.f_g_best: float = float(self.f_x[minimum_index])
+        self.f_x_valid: bool = True
+
+        # indeks tetangga (n_particles, k) dan lBest setiap partikel
+        self.neighbors: np.ndarray | None = (
+            as_neighbors(topology, len(self.x)) if topology is not None else None
+        )
+        self.l_best: np.ndarray = self.p_best.copy()
+
+        self.iteration: int = 0
+        self.stop_reason: str | None = None
+        self.history: History = (
+            history if history is not None else History(dtype=self.dtype)
+        )
+
+        # file checkpoint yang ditulis setiap checkpoint_every iterasi
+        self.checkpoint_path: str | None = None
+        self.checkpoint_every: int = 0
+
+    @classmethod
+    def from_coordinates(
+        cls,
+        coordinates: list[list[float]],
+        v: list[float],
+        c: list[float],
+        r: list[float] | None,
+        w: float,
+        obj_func: Callable[..., float] = obj_func,
+        **kwargs,
+    ) -> "PSO":
+        """
+        Membuat PSO dari list koordinat terpisah seperti pada modul
+        pso_single_variable ([x]) dan pso_multi_variable ([x, y]), untuk
+        jumlah dimensi berapa pun.
+
+        Parameter:
+        - coordinates: List berisi satu list posisi untuk setiap dimensi
+        - v: Velocity awal setiap partikel, dipakai untuk semua dimensi
+        - c, r, w, obj_func, kwargs: Sama seperti PSO
+        """
+        return cls(np.column_stack(coordinates), v, c, r, w, obj_func, **kwargs)
+
+    def coordinate(self, k: int) -> np.ndarray:
+        # posisi seluruh partikel pada dimensi ke-k, misalnya x (0) atau y (1)
+        return self.x[:, k]
+
+    def save(self, path: str) -> None:
+        """
+        Menyimpan seluruh state swarm ke file .npz: posisi, velocity, pBest,
+        gBest, fitness yang tersimpan, state RNG, nomor iterasi dan riwayat.
+        File ditulis ke file sementara lalu diganti secara atomik, sehingga
+        checkpoint lama tetap utuh jika proses terhenti saat menulis.
+        """
+        temporary_path: str = f"{path}.tmp"
+        with open(temporary_path, "wb") as file:
+            np.savez(
+                file,
+                x=self.x,
+                v=self.v,
+                old_x=self.old_x,
+                p_best=self.p_best,
+                g_best=self.g_best,
+                f_x=self.f_x,
+                f_old_x=self.f_old_x,
+                f_p_best=self.f_p_best,
+                f_g_best=np.array(self.f_g_best),
+                f_x_valid=np.array(self.f_x_valid),
+                c=np.array(self.c, dtype=np.float64),
+                r=np.array(self.r if self.r is not None else [], dtype=np.float64),
+                w=np.array(self.w),
+                neighbors=(
+                    self.neighbors
+                    if self.neighbors is not None
+                    else np.empty((0, 0), dtype=np.intp)
+                ),
+                n_evals=np.array(self.n_evals),
+                iteration=np.array(self.iteration),
+                rng_state=np.array(json.dumps(self.rng.bit_generator.state)),
+                **self.history.state(),
+            )
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(
+        cls, path: str, obj_func: Callable[..., float] = obj_func, **kwargs
+    ) -> "PSO":
+        """
+        Membuat PSO dari file hasil save() untuk melanjutkan iterasi. Fungsi
+        objektif tidak ikut disimpan sehingga harus diberikan lagi.
+        """
+        with np.load(path) as data:
+            r: np.ndarray = data["r"]
+            neighbors: np.ndarray = data["neighbors"]
+            pso: PSO = cls(
+                data["x"],
+                data["v"],
+                data["c"].tolist(),
+                r.tolist() if len(r) else None,
+                float(data["w"]),
+                obj_func,
+                history=History.from_state(data),
+                fitness=data["f_x"],
+                topology=neighbors if neighbors.size else None,
+                dtype=data["x"].dtype.type,
+                **kwargs,
+            )
+            pso.old_x = data["old_x"].copy()
+            pso.p_best = data["p_best"].copy()
+            pso.g_best = data["g_best"].copy()
+            pso.f_old_x = data["f_old_x"].copy()
+            pso.f_p_best = data["f_p_best"].copy()
+            pso.f_g_best = float(data["f_g_best"])
+            pso.f_x_valid = bool(data["f_x_valid"])
+            pso.n_evals = int(data["n_evals"])
+            pso.iteration = int(data["iteration"])
+            state: dict = json.loads(str(data["rng_state"]))
+        bit_generator = getattr(np.random, state["bit_generator"])()
+        bit_generator.state = state
+        pso.rng = np.random.Generator(bit_generator)
+        return pso
+
+    def evaluate(self, positions: np.ndarray) -> np.ndarray:
+        # menghitung f(x) untuk seluruh baris positions dalam satu panggilan
+        self.n_evals += len(positions)
+        return np.asarray(self.evaluator(positions), dtype=np.float64).reshape(
+            len(positions)
+        )
+
+    def update_fitness(self) -> None:
+        # mengevaluasi posisi saat ini hanya jika belum pernah dievaluasi
+        if not self.f_x_valid:
+            self.f_x = self.evaluate(self.x)
+            self.f_x_valid = True
+
+    def find_p_best(self) -> None:
+        # memperbarui nilai pBest jika f(x) lebih kecil dari f(x) sebelumnya
+        self.update_fitness()
+        improved: np.ndarray = self.f_x < self.f_old_x
+        self.p_best = np.where(improved[:, np.newaxis], self.x, self.old_x)
+        self.f_p_best = np.where(improved, self.f_x, self.f_old_x)
+
+    def find_g_best(self) -> None:
+        # memperbarui nilai gBest jika f(x) lebih kecil dari f(gBest)
+        self.update_fitness()
+        minimum_index: int = int(np.argmin(self.f_x))
+        if self.f_x[minimum_index] < self.f_g_best:
+            self.g_best = self.x[minimum_index].copy()
+            self.f_g_best = float(self.f_x[minimum_index])
+            self.events.emit(BEST_IMPROVED, self)
+
+    def find_l_best(self) -> None:
+        # memperbarui lBest, yaitu pBest terbaik di antara tetangga partikel
+        self.l_best = self.p_best[local_best(self.neighbors, self.f_p_best)]
+
+    def update_v(self) -> None:
+        """
+        memperbarui velocity seluruh partikel sekaligus, yaitu:
+        v = w*v + c_1*r_1*(pBest - x) + c_2*r_2*(gBest - x)
+        dengan r_1 dan r_2 tetap, atau diambil sekaligus dari self.rng
+        sebagai array (n_particles, n_dims) jika self.r bernilai None.
+        Jika topologi lokal dipakai, gBest diganti lBest setiap partikel
+        """
+        r_1, r_2 = (
+            self.r
+            if self.r is not None
+            else self.rng.random((2, *self.x.shape), dtype=self.dtype)
+        )
+        social: np.ndarray = self.g_best if self.neighbors is None else self.l_best
+        # w atau c bertipe np.float64 (misalnya dari jadwal) tidak boleh
+        # mengubah tipe velocity
+        self.v = (
+            (self.w * self.v)
+            + (self.c[0] * r_1 * (self.p_best - self.x))
+            + (self.c[1] * r_2 * (social - self.x))
+        ).astype(self.dtype, copy=False)
+
+    def update_x(self) -> None:
+        # memperbarui posisi seluruh partikel berdasarkan velocity, f(x) yang
+        # tersimpan berpindah menjadi f(old_x)
+        self.update_fitness()
+        self.old_x[:] = self.x
+        self.f_old_x = self.f_x
+        self.x += self.v
+        self.f_x_valid = False
+
+    def step(self) -> None:
+        # menjalankan satu iterasi PSO dan menyimpan riwayatnya
+        self.events.emit(ITERATION_START, self)
+        self.find_g_best()
+        self.find_p_best()
+        if self.neighbors is not None:
+            self.find_l_best()
+        self.update_v()
+        self.update_x()
+        self.iteration += 1
+        self.history.record(self.iteration, self)
+        self.events.emit(ITERATION_END, self)
+
+    def iterate(
+        self,
+        n: int,
+        workers: int | None = None,
+        chunksize: int | None = None,
+        stop: StoppingCriteria | None = None,
+        checkpoint_path: str | None = None,
+        checkpoint_every: int = 100,
+        shared: bool = False,
+    ) -> Result:
+        """
+        Menjalankan algoritma PSO paling banyak n iterasi.
+
+        Parameter:
+        - n: Jumlah iterasi maksimum
+        - workers: Jika diisi, evaluasi f(x) setiap iterasi dibagi ke
+          sejumlah proses worker (ProcessPoolEvaluator). obj_func harus bisa
+          di-pickle. Hasilnya identik dengan mode serial. Pembungkus yang
+          terpasang (cache, surrogate) tetap dipakai, lihat objective_owner()
+        - chunksize: Jumlah partikel per tugas yang dikirim ke worker
+        - stop: Kriteria berhenti lebih awal (pso_stopping.StoppingCriteria)
+        - checkpoint_path: Jika diisi, state disimpan ke file ini setiap
+          checkpoint_every iterasi dan di akhir iterate, lanjutkan dengan
+          PSO.load(checkpoint_path, obj_func)
+        - checkpoint_every: Jarak iterasi antar checkpoint (K)
+        - shared: Bersama workers, posisi dan f(x) disimpan di shared memory
+          (SharedMemoryEvaluator) sehingga worker hanya menerima rentang
+          indeks, bukan salinan posisi setiap iterasi
+
+        Kembalian:
+        - Result berisi gBest, f(gBest), jumlah iterasi, jumlah evaluasi dan
+          alasan berhenti
+        """
+        owner = self.objective_owner() if workers is not None else None
+        start: int = self.begin(n, stop, checkpoint_path, checkpoint_every)
+        if workers is not None:
+            pool: ProcessPoolEvaluator | SharedMemoryEvaluator = (
+                SharedMemoryEvaluator(self.obj_func, workers, chunksize)
+                if shared
+                else ProcessPoolEvaluator(self.obj_func, workers, chunksize)
+            )
+            self.set_objective(owner, pool)
+            if shared:
+                # x diperbarui di tempat (x += v), sehingga tetap berada di
+                # shared memory selama iterasi
+                self.x = pool.share(self.x)
+        try:
+            for _ in range(n):
+                self.step()
+                self.write_checkpoint()
+                if self.should_stop(stop):
+                    break
+        finally:
+            if workers is not None:
+                if shared:
+                    self.x = self.x.copy()
+                pool.close()
+                self.set_objective(owner, self.obj_func)
+        return self.finish(start)
+
+    def objective_owner(self):
+        """
+        Mencari tempat obj_func dipanggil di dalam evaluator yang terpasang.
+        Evaluator pembungkus seperti pso_memo.MemoizedObjective dan
+        pso_surrogate.SurrogateEvaluator menyimpan fungsi yang dibungkusnya
+        di atribut func. Evaluator paralel dari iterate(workers=...) dipasang
+        di tempat tersebut, sehingga pembungkus tetap bekerja di atasnya.
+
+        Kembalian:
+        - Pembungkus yang atribut func-nya adalah obj_func, atau None jika
+          evaluator adalah obj_func sendiri
+        """
+        owner = None
+        current = self.evaluator
+        while current is not self.obj_func:
+            if isinstance(current, (ProcessPoolEvaluator, SharedMemoryEvaluator)):
+                raise ValueError(
+                    "evaluator paralel sudah terpasang, jangan isi workers"
+                )
+            if not hasattr(current, "func"):
+                raise ValueError(
+                    "evaluator yang terpasang tidak membungkus obj_func, "
+                    "workers tidak bisa dipakai"
+                )
+            owner, current = current, current.func
+        return owner
+
+    def set_objective(self, owner, func: Callable[[np.ndarray], np.ndarray]) -> None:
+        # memasang func di tempat yang ditemukan objective_owner()
+        if owner is None:
+            self.evaluator = func
+        else:
+            owner.func = func
+
+    def begin(
+        self,
+        n: int,
+        stop: StoppingCriteria | None,
+        checkpoint_path: str | None = None,
+        checkpoint_every: int = 100,
+    ) -> int:
+        # persiapan sebelum paling banyak n iterasi, mengembalikan iterasi awal
+        self.history.reserve(self.iteration, n, *self.x.shape)
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self.stop_reason = MAX_ITERATIONS
+        if stop is not None:
+            stop.start(self)
+        return self.iteration
+
+    def write_checkpoint(self, force: bool = False) -> None:
+        # menyimpan checkpoint setiap checkpoint_every iterasi
+        if self.checkpoint_path is not None and (
+            force or self.iteration % self.checkpoint_every == 0
+        ):
+            self.save(self.checkpoint_path)
+
+    def should_stop(self, stop: StoppingCriteria | None) -> bool:
+        # memeriksa kriteria berhenti setelah satu iterasi
+        reason: str | None = stop.check(self) if stop is not None else None
+        if reason is not None:
+            self.stop_reason = reason
+        return reason is not None
+
+    def finish(self, start: int) -> Result:
+        # memancarkan FINISHED dan menyusun hasil sejak iterasi start
+        self.write_checkpoint(force=True)
+        self.checkpoint_path = None
+        self.events.emit(FINISHED, self)
+        return Result(
+            self.g_best.copy(),
+            self.f_g_best,
+            self.iteration - start,
+            self.n_evals,
+            self.stop_reason,
+        )
+
+
+def print_iteration(pso: PSO) -> None:
+    # listener ITERATION_END yang mencetak langkah iterasi seperti modul lain
+    print(f"""iterasi ke-{pso.iteration}
+1.) menentukan x = {pso.old_x.tolist()}
+2.) menentukan f(x) = {pso.f_old_x.round(4).tolist()}
+3.) menentukan gBest = {pso.g_best.tolist()}
+4.) menentukan pBest = {pso.p_best.tolist()}
+5.) menentukan v = {pso.v.tolist()}
+6.) update x = {pso.x.tolist()}\n""")
+
+
+def print_result(pso: PSO) -> None:
+    # listener FINISHED yang mencetak hasil akhir
+    print(f"nilai minimum dari f(x) adalah {pso.f_g_best:.4f}")
+    print(f"jumlah evaluasi f(x) = {pso.n_evals}")
+    print(f"berhenti karena {pso.stop_reason} pada iterasi ke-{pso.iteration}")
+
+
+def main() -> None:
+    x_0, y_0 = 1.0, 1.0
+    x_1, y_1 = -2.0, -1.0
+    x_2, y_2 = 2.0, 2.0
+    v_0: float = 0.0
+    c_1: float = 1.0
+    c_2: float = 0.5
+    r_1: float = 1.0
+    r_2: float = 1.0
+    w: float = 1.0
+    particles: list[list[float]] = [[x_0, y_0], [x_1, y_1], [x_2, y_2]]
+    velocities: list[float] = [v_0 for _ in range(len(particles))]
+    acceleration_coefficients: list[float] = [c_1, c_2]
+    random_numbers: list[float] = [r_1, r_2]
+    inertia_weight: float = w
+    pso: PSO = PSO(
+        particles,
+        velocities,
+        acceleration_coefficients,
+        random_numbers,
+        inertia_weight,
+    )
+    pso.events.subscribe(ITERATION_END, print_iteration)
+    pso.events.subscribe(FINISHED, print_result)
+    pso.iterate(3)
+
+
+if __name__ == "__main__":
+    main()
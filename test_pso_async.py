@@ -0,0 +1,41 @@
+import asyncio
+
+import numpy as np
+
+from pso_async import AsyncPSO, RemoteObjective, simulation_service
+from pso_vectorized import PSO, obj_func
+
+
+async def run_remote(positions: np.ndarray, seed: int, n: int) -> AsyncPSO:
+    # AsyncPSO dengan layanan simulasi lokal pada port bebas (port 0)
+    server: asyncio.Server = await asyncio.start_server(
+        simulation_service, "127.0.0.1", 0
+    )
+    host, port = server.sockets[0].getsockname()[:2]
+    async with server:
+        pso: AsyncPSO = await AsyncPSO.create(
+            positions,
+            0.0,
+            [1.0, 0.5],
+            None,
+            0.7,
+            RemoteObjective(host, port),
+            max_in_flight=10,
+            seed=seed,
+        )
+        await pso.iterate(n)
+    return pso
+
+
+def test_remote_objective_matches_synchronous_engine() -> None:
+    positions: np.ndarray = np.random.default_rng(0).uniform(-5.0, 5.0, (20, 2))
+    remote: AsyncPSO = asyncio.run(run_remote(positions, seed=1, n=5))
+    local: PSO = PSO(positions, 0.0, [1.0, 0.5], None, 0.7, obj_func, seed=1)
+    local.iterate(5)
+
+    np.testing.assert_array_equal(remote.history.x, local.history.x)
+    np.testing.assert_array_equal(remote.history.f_x, local.history.f_x)
+    np.testing.assert_array_equal(remote.x, local.x)
+    np.testing.assert_array_equal(remote.g_best, local.g_best)
+    assert remote.f_g_best == local.f_g_best
+    assert remote.n_evals == local.n_evals
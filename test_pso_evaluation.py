@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from pso_benchmark import sphere
+from pso_memo import use_memo
+from pso_surrogate import use_surrogate
+from pso_vectorized import PSO
+
+
+def run(install, **kwargs) -> PSO:
+    # PSO yang sama dengan evaluator pembungkus dari install(pso)
+    positions: np.ndarray = np.random.default_rng(0).uniform(-5.0, 5.0, (20, 3))
+    pso: PSO = PSO(positions, 0.0, [1.5, 1.5], None, 0.7, sphere, seed=1)
+    install(pso)
+    pso.iterate(15, **kwargs)
+    return pso
+
+
+@pytest.mark.parametrize(
+    "install",
+    [
+        lambda pso: None,
+        lambda pso: use_memo(pso, resolution=0.5),
+        lambda pso: use_surrogate(pso, fraction=0.3),
+    ],
+    ids=["plain", "memo", "surrogate"],
+)
+def test_shared_memory_matches_serial(install) -> None:
+    serial: PSO = run(install)
+    shared: PSO = run(install, workers=2, shared=True)
+
+    np.testing.assert_array_equal(shared.x, serial.x)
+    np.testing.assert_array_equal(shared.history.x, serial.history.x)
+    assert shared.f_g_best == serial.f_g_best
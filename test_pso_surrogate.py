@@ -0,0 +1,17 @@
+import numpy as np
+
+from pso_benchmark import sphere
+from pso_surrogate import use_surrogate
+from pso_vectorized import PSO
+
+
+def test_use_surrogate_seeds_only_evaluated_positions() -> None:
+    positions: np.ndarray = np.random.default_rng(0).uniform(-5.0, 5.0, (20, 3))
+    pso: PSO = PSO(positions, 0.0, [1.5, 1.5], None, 0.7, sphere, seed=1)
+    pso.iterate(3)
+    assert not pso.f_x_valid
+
+    surrogate = use_surrogate(pso, fraction=0.3)
+
+    np.testing.assert_array_equal(surrogate.positions[0], pso.old_x)
+    np.testing.assert_array_equal(surrogate.fitness[0], sphere(pso.old_x))